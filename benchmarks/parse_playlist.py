@@ -0,0 +1,107 @@
+""" Times parsing a synthetic Web API playlist response into the content tree, with the current zotify.api and
+    with zotify.api as of a baseline revision (by default, the tree before ParsePlan replaced the per-call rules).
+
+    Run from the repository root with the package's dependencies installed:
+        python benchmarks/parse_playlist.py [--items 10000] [--repeat 3] [--baseline REV]
+"""
+import argparse
+import copy
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def load_config(config_dir: str) -> None:
+    """ zotify.api reads the config while its classes are defined, so this runs before it is imported """
+    from zotify.config import Zotify, CONFIG_VALUES
+    args = argparse.Namespace(config_location=config_dir, debug=False, update_config=False, update_archive=False,
+                              verify_library=False, no_splash=True, refresh_metadata=False)
+    for cfg in CONFIG_VALUES: setattr(args, cfg.lower(), None)
+    args.root_path = args.root_podcast_path = args.metadata_cache_location = config_dir
+    Zotify.CONFIG.load(args)
+    Zotify.start()
+
+
+def baseline_rev() -> str:
+    introduced = subprocess.run(["git", "log", "--reverse", "--format=%H", "-S", "class ParsePlan", "--", "zotify/api.py"],
+                                cwd=ROOT, capture_output=True, text=True, check=True).stdout.split()
+    if not introduced:
+        sys.exit("ParsePlan not found in the history of zotify/api.py, pass --baseline")
+    return introduced[0] + "^"
+
+
+def load_baseline(rev: str, workdir: str):
+    source = subprocess.run(["git", "show", f"{rev}:zotify/api.py"], cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    path = Path(workdir) / "api_baseline.py"
+    path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location("zotify.api_baseline", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def artist(i: int) -> dict:
+    return {'id': f'a{i}', 'name': f'Artist {i}', 'uri': f'spotify:artist:a{i}', 'type': 'artist'}
+
+
+def track(i: int) -> dict:
+    return {'id': f't{i:05d}', 'name': f'Track {i}', 'uri': f'spotify:track:t{i:05d}', 'type': 'track',
+            'duration_ms': 180000 + i, 'disc_number': 1, 'track_number': i % 20 + 1, 'explicit': False,
+            'popularity': 50, 'is_local': False, 'is_playable': True, 'external_urls': {'spotify': 'url'},
+            'external_ids': {'isrc': f'ISRC{i:05d}'}, 'artists': [artist(i % 97), artist(i % 13)],
+            'album': {'id': f'al{i % 500}', 'name': f'Album {i % 500}', 'uri': f'spotify:album:al{i % 500}', 'type': 'album',
+                      'album_type': 'album', 'release_date': '2020-01-02', 'total_tracks': 20, 'artists': [artist(i % 97)],
+                      'images': [{'url': 'small', 'width': 64}, {'url': 'large', 'width': 640}]}}
+
+
+def playlist(n_items: int) -> dict:
+    return {'id': 'p', 'name': 'Playlist', 'uri': 'spotify:playlist:p', 'type': 'playlist', 'snapshot_id': None,
+            'collaborative': False, 'public': True, 'followers': {'total': 1},
+            'owner': {'id': 'o', 'display_name': 'Owner', 'uri': 'spotify:user:o', 'type': 'user'},
+            'items': {'total': n_items, 'next': None,
+                      'items': [{'added_at': '2020-01-01T00:00:00Z', 'is_local': False, 'item': track(i),
+                                 'added_by': {'id': f'u{i % 5}', 'uri': f'spotify:user:u{i % 5}', 'type': 'user'}}
+                                for i in range(n_items)]}}
+
+
+def time_parse(api, resp: dict, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        item_resps = [copy.deepcopy(resp)] # parsing consumes the response
+        api.HierarchicalNode.ALL_NODES = {}
+        query = api.Query("benchmark")
+        time_start = time.perf_counter()
+        query.parse_relatives(item_resps, api.Playlist)
+        best = min(best, time.perf_counter() - time_start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", help="git revision to compare against")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        load_config(workdir)
+        import zotify.api as current
+        baseline = load_baseline(args.baseline or baseline_rev(), workdir)
+
+        resp = playlist(args.items)
+        before = time_parse(baseline, resp, args.repeat)
+        after = time_parse(current, resp, args.repeat)
+    print(f"{args.items} item playlist, best of {args.repeat}")
+    print(f"baseline: {before:.3f}s")
+    print(f"current:  {after:.3f}s ({before / after:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class Track:
+    type_attr = "track"
+
+
+@pytest.fixture
+def metadata_cache(tmp_path):
+    from zotify.config import Zotify, CONFIG_VALUES
+    args = argparse.Namespace(config_location=str(tmp_path), debug=False, update_config=False, update_archive=False,
+                              verify_library=False, no_splash=True, refresh_metadata=False)
+    for cfg in CONFIG_VALUES: setattr(args, cfg.lower(), None)
+    args.root_path = args.root_podcast_path = args.metadata_cache_location = str(tmp_path)
+    Zotify.CONFIG.load(args)
+
+    from zotify.utils import MetadataCache
+    MetadataCache._CONN = None
+    yield MetadataCache
+    MetadataCache.conn().close()
+    MetadataCache._CONN = None
+
+
+def test_libre_response_round_trip(metadata_cache):
+    # invoke_libre_md swaps the top level gid for the raw bytes audio key lookups need
+    resp = {'gid': bytes.fromhex('0a1b2c3d4e5f60718293a4b5c6d7e8f9'), 'name': 'Track',
+            'album': {'gid': 'ChssPU5fYHGCk6S1xtfo+Q==', 'name': 'Album'}, 'duration': 180000}
+    metadata_cache.put(Track, 't', resp, "libre")
+    cached = metadata_cache.get(Track, 't', "libre")
+    assert cached == resp
+    assert isinstance(cached['gid'], bytes)
+
+
+def test_marker_shaped_dict_without_bytes_is_untouched(metadata_cache):
+    resp = {'name': 'Track', 'extra': {metadata_cache.BYTES_MARKER: 'zz', 'other': 1}}
+    metadata_cache.put(Track, 't', resp, "web")
+    assert metadata_cache.get(Track, 't', "web") == resp
@@ -51,6 +51,10 @@ def main():
                         action='store_true',
                         dest='update_archive',
                         help='Updates the `.song_archive` file entries with full paths while keeping non-findable entries unchanged')
+    parser.add_argument('--refresh-metadata',
+                        action='store_true',
+                        dest='refresh_metadata',
+                        help='Ignore cached metadata and fetch everything from the API again, refreshing the cache')
     parser.add_argument('--debug',
                         action='store_true',
                         dest='debug',
@@ -1,6 +1,11 @@
 from __future__ import annotations
 import music_tag
-import requests
+import sys
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from copy import deepcopy
+from threading import Event, Lock, RLock, current_thread, main_thread
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator
 from uuid import uuid4
 
 from zotify.config import Zotify, Streamer
@@ -20,15 +25,39 @@ class DynamicClassNameAttrs(type):
         cls.uppers = cls.lowers.upper()
 
 
+# shared stand-in for per-node relation maps until a node records its first entry
+NO_RELATIONS: MappingProxyType = MappingProxyType({})
+
+
 class HierarchicalNode(metaclass=DynamicClassNameAttrs):
+    # a large query keeps hundreds of thousands of nodes alive in ALL_NODES, so edges are slotted
+    # and their sets only allocated once a node is actually linked
+    __slots__ = ("_parents", "_children", "__dict__")
     _root_node = False
     ALL_NODES: dict[HierarchicalNode, HierarchicalNode] = {}
     
     def __init__(self):
-        self.parents:           set[HierarchicalNode] = set()
-        self.children:          set[HierarchicalNode] = set()
+        self._parents:          set[HierarchicalNode] | None = None
+        self._children:         set[HierarchicalNode] | None = None
         self.ALL_NODES[self] = self
     
+    @property
+    def parents(self) -> set[HierarchicalNode]:
+        if self._parents is None: self._parents = set()
+        return self._parents
+    
+    @property
+    def children(self) -> set[HierarchicalNode]:
+        if self._children is None: self._children = set()
+        return self._children
+    
+    def own(self, attr: str, factory: type[dict] | type[set] = dict) -> dict | set:
+        """ This node's own container for attr, replacing the shared empty class default on first write """
+        owned = self.__dict__.get(attr)
+        if owned is None:
+            owned = self.__dict__[attr] = factory()
+        return owned
+    
     def get_if_exists(self, node_comparable) -> HierarchicalNode | None:
         return self.ALL_NODES.get(node_comparable)
     
@@ -41,7 +70,322 @@ class HierarchicalNode(metaclass=DynamicClassNameAttrs):
         parent_to_be.children.add(self)
 
 
+class ParsePlan:
+    """ Compiled once per Content subclass by parse_metadata: casters for the scalar fields and, in order,
+        only the response handlers that can apply to that class """
+    PARSE_AS_STR        = {ADDED_AT, ALBUM_TYPE, DESCRIPTION, DISC_NUMBER, DISPLAY_NAME, EXTERNAL_URL,
+                           ID, ITEM_ID, LABEL, NAME, PUBLISHER, RELEASE_DATE, REVISION, SNAPSHOT_ID,}
+    INT_PARSE_AS_STR    = {TOTAL_EPISODES, TOTAL_TRACKS, TRACK_NUMBER,}
+    PARSE_AS_INT        = {DURATION_MS, LENGTH, POPULARITY, TIMESTAMP,}
+    PARSE_AS_BOOL       = {COLLABORATIVE, DELETED_BY_OWNER, EXPLICIT,
+                           IS_EXTERNALLY_HOSTED, IS_LOCAL, IS_PLAYABLE, PUBLIC,}
+    PARSE_AS_IS         = {EXTERNAL_URLS, GID, GENRES,}
+    
+    def __init__(self, ContClass: type[Content]):
+        # response key -> (type to cast to or None to keep as is, zero pad to two digits)
+        self.casters: dict[str, tuple[type | None, bool]] = {}
+        self.casters |= {k: (str, False) for k in self.PARSE_AS_STR}
+        self.casters |= {k: (str, True) for k in self.INT_PARSE_AS_STR}
+        self.casters |= {k: (int, False) for k in self.PARSE_AS_INT}
+        self.casters |= {k: (bool, False) for k in self.PARSE_AS_BOOL}
+        self.casters |= {k: (None, False) for k in self.PARSE_AS_IS}
+        
+        # (classes the handler applies to, response keys that trigger it, handler), in the order they must run
+        handlers: list[tuple[tuple[type[Content], ...], tuple[str, ...], Callable]] = [
+            ((Artist,),             (ACTIVITY_PERIOD,),             self.parse_activity_period),
+            ((DLContent,),          (ADDED_BY,),                    self.parse_added_by),
+            ((Track,),              (),                             self.parse_album),
+            ((Artist, Album),       (ALBUM_GROUP,),                 self.parse_album_group),
+            ((Artist,),             (APPEARS_ON_GROUP,),            self.parse_appears_on),
+            ((Track, Album),        (ARTIST, ARTISTS),              self.parse_artists),
+            ((DLContent,),          (AUDIO, FILE, ALTERNATIVE),     self.parse_files),
+            ((Artist,),             (BIOGRAPHY,),                   self.parse_biography),
+            ((Playlist,),           (CONTENTS, OWNER_USERNAME),     self.parse_collaborators),
+            ((Playlist,),           (CONTENTS,),                    self.parse_contents),
+            ((Content,),            (COVER_GROUP, IMAGES),          self.parse_covers),
+            ((Album,),              (DATE,),                        self.parse_date),
+            ((Album,),              (DISC,),                        self.parse_discs),
+            ((Show,),               (EPISODES,),                    self.parse_episodes),
+            ((Track, Album),        (EXTERNAL_ID, EXTERNAL_IDS),    self.parse_external_ids),
+            ((Playlist,),           (OWNER_USERNAME, OWNER),        self.parse_owner),
+            ((Playlist,),           (ITEMS,),                       self.parse_playlist_items),
+            ((Episode,),            (PUBLISH_TIME,),                self.parse_publish_time),
+            ((Episode,),            (),                             self.parse_show),
+            ((Artist,),             (SINGLE_GROUP,),                self.parse_singles),
+            ((Content,),            (TIMESTAMP,),                   self.parse_timestamp),
+            ((Content,),            (FOLLOWERS,),                   self.parse_followers),
+            ((Artist,),             (TOP_TRACK,),                   self.parse_top_tracks),
+            ((Album,),              (TRACKS,),                      self.parse_tracks),
+        ]
+        self.handlers: list[tuple[tuple[str, ...], Callable]] = [(triggers, handler) for classes, triggers, handler
+                                                                  in handlers if issubclass(ContClass, classes)]
+        
+        if issubclass(ContClass, (DLContent, Playlist, User, Show)):
+            self.finalize = self.finalize_named
+        elif issubclass(ContClass, Artist):
+            self.finalize = self.finalize_artist
+        elif issubclass(ContClass, Album):
+            self.finalize = self.finalize_album
+        else:
+            self.finalize = None
+    
+    def parse(self, obj: Content, relative: Content | None, resp: dict) -> dict[str, Any]:
+        """ Returns the parsed attributes in the order they were first set, None meaning absent """
+        md: dict[str, Any] = {}
+        
+        casters = self.casters
+        for key, raw in resp.items():
+            caster = casters.get(key)
+            if caster is None or raw is None: continue
+            to_cast, zfill = caster
+            val = raw if to_cast is None or isinstance(raw, to_cast) else safe_typecast(resp, key, to_cast)
+            md[key] = val.zfill(2) if zfill else val
+        
+        # triggers are checked as handlers run, earlier handlers may add keys to resp for later ones
+        for triggers, handler in self.handlers:
+            if not triggers or any(map(resp.get, triggers)):
+                handler(obj, relative, resp, md)
+        
+        album_type = md.get(ALBUM_TYPE)
+        md[COMPILATION] = album_type == COMPILATION if album_type else None
+        release_date = md.get(RELEASE_DATE)
+        md[YEAR] = release_date.split('-')[0] if release_date else None
+        
+        # hasMetadata must be last attribute set
+        if self.finalize: self.finalize(md)
+        return md
+    
+    @staticmethod
+    def ensure_uri(item: dict | None, type_attr_and_ind: str, md: dict[str, Any]):
+        if item is None: return
+        gid = item.get(GID);  uri = item.get(URI)
+        name = item.get(NAME); typ = item.get(TYPE)
+        
+        # handle missing TYPE
+        if not typ: item[TYPE] = type_attr_and_ind.lower().strip("0123456789")
+        
+        # handle METADATA_PREFETCH
+        if gid and not uri:
+            uri = f":{item[TYPE]}:{Zotify.id_from_gid(gid)}"
+            md["needs_recursion"] = True
+        
+        # handle local files
+        if not name: name = f"noname-{uuid4()}"
+        if not uri:  uri = f":local:{type_attr_and_ind.lower()}:{name}:::"
+        item[URI] = uri
+    
+    @staticmethod
+    def ensure_user_resp(username: str | None) -> dict | None:
+        if not username: return None
+        return {URI         : f":{USER}:{username}",
+                TYPE        : USER,
+                DISPLAY_NAME: User.fetch_display_name(username)}
+    
+    def parse_activity_period(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        periods = {k: v for period in resp[ACTIVITY_PERIOD] for k, v in period.items()}
+        md[START_YEAR] = safe_typecast(periods, START_YEAR, str)
+        md[END_YEAR] = safe_typecast(periods, END_YEAR, str)
+    
+    def parse_added_by(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        md[ADDED_BY] = obj.parse_relatives([resp[ADDED_BY]], User, make_parent=True)[0]
+    
+    def parse_album(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        album: dict = resp.get(ALBUM)
+        if isinstance(relative, Album):
+            md[ALBUM] = relative
+        elif album:
+            self.ensure_uri(album, ALBUM, md)
+            md[ALBUM] = obj.parse_relatives([album], Album, make_parent=True)[0]
+    
+    def parse_album_group(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        if isinstance(obj, Artist):
+            album_entries = [a[ALBUM][0] for a in resp[ALBUM_GROUP] if a.get(ALBUM)]
+            for a in album_entries:                 self.ensure_uri(a, ALBUM, md)
+            md[ALBUMS] = obj.parse_relatives(album_entries, Album)
+        else:
+            md[ALBUM_GROUP] = safe_typecast(resp, ALBUM_GROUP, str)
+            md["needs_expansion"] = True
+    
+    def parse_appears_on(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        appears_entries = [a[ALBUM][0] for a in resp[APPEARS_ON_GROUP] if a.get(ALBUM)]
+        for a in appears_entries:                   self.ensure_uri(a, ALBUM, md)
+        md[APPEARS_ON] = obj.parse_relatives(appears_entries, Album)
+    
+    def parse_artists(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        artists: list[dict] = resp.get(ARTIST) or resp.get(ARTISTS)
+        for i, a in enumerate(artists):             self.ensure_uri(a, ARTIST + str(i+1), md)
+        md[ARTISTS] = obj.parse_relatives(artists, Artist, make_parent=True)
+    
+    def parse_files(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        files: list[dict] = resp.get(FILE)
+        alternatives: list[dict] = resp.get(ALTERNATIVE)
+        files = files if files is not None else resp.get(AUDIO)
+        if not files and alternatives:
+            for alt in alternatives:
+                files = alt.get(FILE)
+                if files: break
+        if files:
+            md[IS_PLAYABLE] = True
+            md["file_ids"] = files
+    
+    def parse_biography(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        md[BIOGRAPHY] = resp[BIOGRAPHY][0].get(TEXT)
+    
+    def parse_collaborators(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        # every user ensure_user_resp will name for this page, resolved in one batch up front
+        items: list[dict] = (resp.get(CONTENTS) or {}).get(ITEMS) or []
+        User.fetch_display_names([resp.get(OWNER_USERNAME)] +
+                                 [(item.get(ATTRIBUTES) or {}).get(ADDED_BY) for item in items])
+    
+    def parse_contents(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        contents: dict = resp[CONTENTS]
+        items: list[dict] = contents.get(ITEMS)
+        if not items: return
+        for i, item in enumerate(items):
+            attr: dict = item.pop(ATTRIBUTES, None)
+            if attr is None: continue
+            self.ensure_uri(item, TRACK + str(i+1), md)
+            item[ADDED_AT] = timestamp_utc(attr.get(TIMESTAMP))
+            item[ADDED_BY] = self.ensure_user_resp(attr.get(ADDED_BY))
+            item[ITEM_ID] = attr.get(ITEM_ID)
+        md["tracks_or_eps"] = obj.parse_relatives(items, (Track, Episode))
+        md["needs_recursion"] = True
+        if contents.get(TRUNCATED):
+            md["needs_expansion"] = True
+            Printer.hashtaged(PrintChannel.WARNING, f'PLAYLIST {md.get(NAME)} MISSING FINAL {md.get(LENGTH) - len(items)} ITEMS\n' +
+                                                     'NOT RECOVERABLE WITHOUT A LEGACY DEVELOPER CLIENT')
+    
+    def parse_covers(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        covers = resp.get(IMAGES) or resp[COVER_GROUP].get(IMAGE, [])
+        largest_cover: dict = max(covers, key=lambda img: safe_typecast(img, WIDTH, int),
+                                  default={URL: None, FILE_ID: None})
+        if largest_cover.get(FILE_ID):
+            largest_cover[URL] = IMAGE_URL_PREFIX + Zotify.hex_id_from_file_id(largest_cover.get(FILE_ID))
+        md[IMAGE_URL] = largest_cover.get(URL)
+    
+    def parse_date(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        if not md.get(RELEASE_DATE):
+            md[RELEASE_DATE] = "-".join(str(v) for v in resp[DATE].values())
+    
+    def parse_discs(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        track_entries: list[dict] = []
+        for disc in resp[DISC]:
+            for i, t in enumerate(disc.get(TRACK, [])):
+                self.ensure_uri(t, TRACK + str(i+1), md)
+                t[DISC_NUMBER]  = disc.get(NUMBER)
+                t[TRACK_NUMBER] = i + 1
+            track_entries.extend(disc.get(TRACK, []))
+        resp.update({TRACKS: {ITEMS: track_entries, NEXT: None}})
+    
+    def parse_episodes(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        episodes: dict = resp[EPISODES]
+        items: list[dict] = episodes.get(ITEMS)
+        if items:
+            for i, e in enumerate(items):     self.ensure_uri(e, EPISODE + str(i+1), md)
+            md[EPISODES] = obj.parse_relatives(items, Episode)
+            md["needs_expansion"] = episodes[NEXT] is not None
+        else:
+            md["needs_expansion"] = True
+    
+    def parse_external_ids(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        external_id: list[dict] = resp.get(EXTERNAL_ID)
+        external_ids: dict = {eid.get(TYPE): eid.get(ID) for eid in external_id} if external_id else resp[EXTERNAL_IDS]
+        md[EAN] = external_ids.get(EAN)
+        md[ISRC] = external_ids.get(ISRC)
+        md[UPC] = external_ids.get(UPC)
+    
+    def parse_owner(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        owner_username: str = resp.get(OWNER_USERNAME)
+        if owner_username:
+            resp[OWNER] = self.ensure_user_resp(owner_username)
+        if resp.get(OWNER):
+            owner: User = obj.parse_relatives([resp[OWNER]], User, make_parent=True)[0]
+            owner.name = owner.display_name
+            md[OWNER] = owner
+    
+    def parse_playlist_items(self, obj: Playlist, relative: Content | None, resp: dict, md: dict[str, Any]):
+        playlist_items: dict = resp[ITEMS]
+        md[LENGTH] = resp.get(TOTAL)
+        items: list[dict] = playlist_items.get(ITEMS)
+        if items:
+            tracks_eps_empty = obj.unwrap(items)
+            for i, t_or_e in enumerate(tracks_eps_empty):
+                self.ensure_uri(t_or_e, TRACK + str(obj.ccount+i+1), md)
+            md["tracks_or_eps"] = obj.parse_relatives(tracks_eps_empty, (Track, Episode))
+            if not any(md["tracks_or_eps"]):
+                Printer.hashtaged(PrintChannel.WARNING,
+                                  f'PLAYLIST "{md.get(NAME)}" ({obj.uri})\n' +
+                                   '[Playlist.Items.Items] METADATA ENTIRELY ABSENT\n' +
+                                   'RECOMMENDED TO SET CONFIG "API_CLIENT_LEGACY = False"')
+        else: # should never be called
+            Printer.hashtaged(PrintChannel.WARNING,
+                              f'PLAYLIST "{md.get(NAME)}" ({obj.uri})\n' +
+                               'HAS [Playlist.Items] BUT NO [Playlist.Items.Items]\n' +
+                               'RECOMMENDED TO SET CONFIG "API_CLIENT_LEGACY = False"')
+        md["needs_expansion"] = not items or playlist_items.get(NEXT) is not None
+    
+    def parse_publish_time(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        publish_time: dict[str, int] = resp[PUBLISH_TIME]
+        dt = datetime(publish_time.get(YEAR), publish_time.get(MONTH), publish_time.get(DAY),
+                      publish_time.get(HOUR, 0), publish_time.get(MINUTE, 0))
+        md[PUBLISH_TIME] = dt_to_str(dt)
+        md[RELEASE_DATE] = dt_to_str(dt.date())
+    
+    def parse_show(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        show: dict = resp.get(SHOW)
+        if isinstance(relative, Show):
+            md[SHOW] = relative
+        elif show:
+            self.ensure_uri(show, SHOW, md)
+            md[SHOW] = obj.parse_relatives([show], Show, make_parent=True)[0]
+    
+    def parse_singles(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        single_entries = [a[ALBUM][0] for a in resp[SINGLE_GROUP] if a.get(ALBUM)]
+        for a in single_entries:                    self.ensure_uri(a, ALBUM, md)
+        md[SINGLES] = obj.parse_relatives(single_entries, Album)
+    
+    def parse_timestamp(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        md[TIMESTAMP] = timestamp_utc(resp[TIMESTAMP])
+    
+    def parse_followers(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        md[FOLLOWERS] = safe_typecast(resp[FOLLOWERS], TOTAL, int)
+    
+    def parse_top_tracks(self, obj: Content, relative: Content | None, resp: dict, md: dict[str, Any]):
+        track_entries = resp[TOP_TRACK][0].get(TRACK)
+        if track_entries:
+            for i, t in enumerate(track_entries):   self.ensure_uri(t, TRACK + str(i+1), md)
+            md["top_tracks"] = obj.parse_relatives(track_entries, Track)
+    
+    def parse_tracks(self, obj: Album, relative: Content | None, resp: dict, md: dict[str, Any]):
+        tracks: dict = resp[TRACKS]
+        items: list[dict] = tracks.get(ITEMS)
+        if items:
+            for i, t in enumerate(items): self.ensure_uri(t, TRACK + str(obj.ccount+i+1), md)
+            md[TRACKS] = obj.parse_relatives(items, Track)
+            md["needs_expansion"] = tracks.get(NEXT) is not None
+            if not md["needs_expansion"]:
+                # set in Album.grab_more_children() later if album incomplete
+                md["total_discs"] = safe_typecast(items[-1], DISC_NUMBER, int)
+                md[DURATION_MS] = sum(int(t.duration_ms) if t.duration_ms else 0 for t in md[TRACKS])
+        else:
+            md["needs_expansion"] = True
+    
+    @staticmethod
+    def finalize_named(md: dict[str, Any]):
+        md["hasMetadata"] = bool(md.get(NAME))
+    
+    @staticmethod
+    def finalize_artist(md: dict[str, Any]):
+        md["all_albums"] = (md.get(ALBUMS) or []) + (md.get(SINGLES) or []) + (md.get(APPEARS_ON) or [])
+        md["hasMetadata"] = bool(md.get(GENRES))
+    
+    @staticmethod
+    def finalize_album(md: dict[str, Any]):
+        md["hasMetadata"] = bool(md.get(TRACKS))
+
+
 class Content(HierarchicalNode):
+    __slots__ = ("uri", "id", "_hash")
     # CONFIG must be loaded with args before any Content classes are instantiated/imported
     _path_root: PurePath = Zotify.CONFIG.get_root_path()
     _regex_flag: re.Pattern | None = None
@@ -49,14 +393,17 @@ class Content(HierarchicalNode):
     _to_db_attrs: list[str] = []
     _fetch_args = ""
     _url = ""
+    _parse_plan: ParsePlan | None = None # compiled per subclass on first parse
+    _dl_lock = RLock() # guards download bookkeeping shared between download workers
     
     def __init__(self, uri: str):
         # uri   == {type} : {id}
         # user  == user   : {user}:{type}:{id}
         # local == local  : {artist}:{album_title}:{track_title}:{duration_sec}
-        self.uri = uri
+        self.uri = sys.intern(uri)
+        self._hash = hash(self.uri)
         super().__init__()
-        self.id = self.uri.split(":", 1)[-1]
+        self.id = sys.intern(self.uri.split(":", 1)[-1])
         self.is_local = self.id.count(":") > 0
         
         self.downloaded = False
@@ -70,7 +417,7 @@ class Content(HierarchicalNode):
         return False
     
     def __hash__(self):
-        return hash(self.uri)
+        return self._hash
     
     def __str__(self):
         default = fix_filename(f"({self.type_attr}){self.id}")
@@ -109,13 +456,28 @@ class Content(HierarchicalNode):
             return p
     
     @classmethod
-    def fetch_metadata(cls, uri: str, args: list[str] = []) -> dict[str]:
-        resp = {}
+    def metadata_source(cls, args: list[str] = []) -> str:
+        """ Which endpoint family fetch_metadata will use, responses from different sources are not interchangeable """
         if Zotify.CONFIG.permit_legacy_api() or (Zotify.CONFIG.permit_client_api() and not cls is Playlist):
+            return "api" + arg_comb(cls._fetch_args, *args)
+        return "libre"
+    
+    @classmethod
+    def fetch_metadata(cls, uri: str, args: list[str] = []) -> dict[str]:
+        return SingleFlight.do((cls, uri, tuple(args)), cls.fetch_metadata_uncoalesced, uri, args, copy_result=True)
+    
+    @classmethod
+    def fetch_metadata_uncoalesced(cls, uri: str, args: list[str] = []) -> dict[str]:
+        source = cls.metadata_source(args)
+        resp = MetadataCache.get(cls, uri.split(":")[-1], source)
+        if resp: return resp
+        
+        if source != "libre":
             argstr = arg_comb(cls._fetch_args, *args)
             resp = Zotify.invoke_url(f'{cls._url}/{uri.split(":")[-1]}?{MARKET_APPEND}{argstr}')
         else:
             resp = Zotify.invoke_libre_md(cls, uri)
+            fetched = bool(resp) # failed lookups still return a stub below, which must not be cached
             if cls is Track and resp.get(DURATION):
                 resp[DURATION_MS] = resp.pop(DURATION)
                 if resp[ALBUM]:
@@ -125,7 +487,9 @@ class Content(HierarchicalNode):
             elif cls is Playlist and resp.get(ATTRIBUTES):
                 resp.update(resp.pop(ATTRIBUTES))
             resp.update({URI: ":" + uri, TYPE: cls.type_attr})
-        if resp: return resp
+        if resp:
+            if source != "libre" or fetched: MetadataCache.put(cls, uri.split(":")[-1], resp, source)
+            return resp
         else:    raise ValueError("No Metadata Fetched")
     
     @staticmethod
@@ -134,20 +498,50 @@ class Content(HierarchicalNode):
         if not uris: return []
         elif not loader_text: loader_text = ContClass.type_attr
         
+        ids = [uri.split(":")[-1] for uri in uris]
+        cached = MetadataCache.get_many(ContClass, ids, ContClass.metadata_source())
+        if len(cached) == len(set(ids)):
+            return [cached[id] for id in ids]
+        missed_uris = list(dict.fromkeys(uri for uri, id in zip(uris, ids) if id not in cached))
+        
         if Zotify.CONFIG.permit_legacy_api() and not ContClass is Playlist:
             with Loader(f"Fetching bulk {loader_text} information...", disabled=hide_loader):
                 fetch_url = f"{ContClass._url}?{MARKET_APPEND}&{BULK_APPEND}"
-                ids = [uri.split(":")[-1] for uri in uris]
-                resps = Zotify.invoke_url_bulk(fetch_url, ids, ContClass.lowers, ITEM_BULK_FETCH[ContClass])
-            if resps: return resps
-            Printer.hashtaged(PrintChannel.WARNING, 'API BULK ENDPOINTS NOT ACCESSIBLE FOR THIS CLIENT_ID\n' +
-                                                    'THIS WILL ALSO INHIBIT PLAYLIST ITEM FETCHING\n' +
-                                                    'RECOMMENDED TO SET CONFIG "API_CLIENT_LEGACY = False"')
-            Zotify.LEGACY_API_ENDOINTS = False
+                missed_ids = [uri.split(":")[-1] for uri in missed_uris]
+                resps = Zotify.invoke_url_bulk(fetch_url, missed_ids, ContClass.lowers, ITEM_BULK_FETCH[ContClass])
+            if resps:
+                return Content.merge_bulk_resps(ContClass, ids, cached, resps)
+            Content.disable_legacy_api()
         
         suffix = "..." if Zotify.CONFIG.permit_client_api() else " (unsafe)..."
         with Loader(f"Fetching {loader_text} information{suffix}", disabled=hide_loader):
-            return [ContClass.fetch_metadata(uri) for uri in uris]
+            return Content.fetch_each_metadata(uris, ContClass)
+    
+    @staticmethod
+    def fetch_each_metadata(uris: list[str], ContClass: type[Content]) -> list[dict]:
+        """ One lookup per unique uri, up to API_CONCURRENCY at once, returned in the order of uris """
+        unique_uris = list(dict.fromkeys(uris))
+        if Zotify.CONFIG.get_api_concurrency() > 1 and len(unique_uris) > 1:
+            with ThreadPoolExecutor(Zotify.CONFIG.get_api_concurrency(), thread_name_prefix="zotify-api") as executor:
+                fetched = dict(zip(unique_uris, executor.map(ContClass.fetch_metadata, unique_uris)))
+        else:
+            fetched = {uri: ContClass.fetch_metadata(uri) for uri in unique_uris}
+        return [fetched[uri] for uri in uris]
+    
+    @staticmethod
+    def merge_bulk_resps(ContClass: type[Content], ids: list[str], cached: dict[str, dict], resps: list[dict]) -> list[dict]:
+        """ Order bulk responses and cache hits by requested id, caching the fresh responses """
+        # match by id rather than position, relinked tracks answer with their original id in linked_from
+        fetched = {(r.get(LINKED_FROM) or r)[ID]: r for r in resps if r and (r.get(LINKED_FROM) or r).get(ID)}
+        MetadataCache.put_many(ContClass, fetched, ContClass.metadata_source())
+        return [cached[id] if id in cached else fetched.get(id) for id in ids]
+    
+    @staticmethod
+    def disable_legacy_api() -> None:
+        Printer.hashtaged(PrintChannel.WARNING, 'API BULK ENDPOINTS NOT ACCESSIBLE FOR THIS CLIENT_ID\n' +
+                                                'THIS WILL ALSO INHIBIT PLAYLIST ITEM FETCHING\n' +
+                                                'RECOMMENDED TO SET CONFIG "API_CLIENT_LEGACY = False"')
+        Zotify.LEGACY_API_ENDOINTS = False
     
     def make_or_link_relative(self, relative_uri: str, RelativeClass: type[Content], make_parent: bool = False) -> Content | Container:
         relative_to_be = self.get_if_exists(relative_uri)
@@ -157,269 +551,17 @@ class Content(HierarchicalNode):
         self.be_supervised(relative_to_be) if make_parent else self.adopt(relative_to_be)
         return relative_to_be
     
+    @classmethod
+    def parse_plan(cls) -> ParsePlan:
+        plan: ParsePlan | None = cls.__dict__.get("_parse_plan")
+        if plan is None:
+            plan = cls._parse_plan = ParsePlan(cls)
+        return plan
+    
     def parse_metadata(self, relative: Content | None, resp: dict):
-        class Metadata():
-            PARSE_AS_STR        = {ADDED_AT, ALBUM_TYPE, DESCRIPTION, DISC_NUMBER, DISPLAY_NAME, EXTERNAL_URL,
-                                   ID, ITEM_ID, LABEL, NAME, PUBLISHER, RELEASE_DATE, REVISION, SNAPSHOT_ID,}
-            INT_PARSE_AS_STR    = {TOTAL_EPISODES, TOTAL_TRACKS, TRACK_NUMBER,}
-            PARSE_AS_INT        = {DURATION_MS, LENGTH, POPULARITY, TIMESTAMP,}
-            PARSE_AS_BOOL       = {COLLABORATIVE, DELETED_BY_OWNER, EXPLICIT,
-                                   IS_EXTERNALLY_HOSTED, IS_LOCAL, IS_PLAYABLE, PUBLIC,}
-            
-            def __init__(self, obj: Content, resp: dict):
-                for attr in self.PARSE_AS_STR:
-                    setattr(self, attr, safe_typecast(resp, attr, str))
-                for attr in self.INT_PARSE_AS_STR:
-                    raw_val: str | None = safe_typecast(resp, attr, str)
-                    setattr(self, attr, None if raw_val is None else raw_val.zfill(2))
-                for attr in self.PARSE_AS_INT:
-                    setattr(self, attr, safe_typecast(resp, attr, int))
-                for attr in self.PARSE_AS_BOOL:
-                    setattr(self, attr, safe_typecast(resp, attr, bool))
-                self.external_urls          : dict              = resp.get(EXTERNAL_URLS)
-                self.gid                    : bytes             = resp.get(GID)
-                self.genres                 : list[str]         = resp.get(GENRES)
-                # self.lyrics               : list[str]         = resp.get(LYRICS)
-                
-                def ensure_uri(item: dict | None, type_attr_and_ind: str):
-                    if item is None: return
-                    gid = item.get(GID);  uri = item.get(URI)
-                    name = item.get(NAME); typ = item.get(TYPE)
-                    
-                    # handle missing TYPE
-                    if not typ: item[TYPE] = type_attr_and_ind.lower().strip("0123456789")
-                    
-                    # handle METADATA_PREFETCH
-                    if gid and not uri:
-                        uri = f":{item[TYPE]}:{Zotify.id_from_gid(gid)}"
-                        self.needs_recursion = True
-                    
-                    # handle local files
-                    if not name: name = f"noname-{uuid4()}"
-                    if not uri:  uri = f":local:{type_attr_and_ind.lower()}:{name}:::"
-                    item[URI] = uri
-                
-                def ensure_user_resp(username: str | None) -> dict | None:
-                    if not username: return None
-                    return {URI         : f":{USER}:{username}",
-                            TYPE        : USER,
-                            DISPLAY_NAME: User.fetch_display_name(username)}
-                
-                activity_period             : list[dict]        = resp.get(ACTIVITY_PERIOD)
-                if activity_period:
-                    periods = {k: v for period in activity_period for k, v in period.items()}
-                    self.start_year         : str               = safe_typecast(periods, START_YEAR, str)
-                    self.end_year           : str               = safe_typecast(periods, END_YEAR, str)
-                
-                added_by                    : dict              = resp.get(ADDED_BY)
-                if added_by:
-                    self.added_by           : User              = obj.parse_relatives([added_by], User, make_parent=True)[0]
-                
-                album                       : dict              = resp.get(ALBUM)
-                if isinstance(obj, Track) and isinstance(relative, Album):
-                    self.album              : Album             = relative
-                elif album:
-                    ensure_uri(album, ALBUM)
-                    parent = isinstance(obj, Track)
-                    self.album              : Album             = obj.parse_relatives([album], Album, make_parent=parent)[0]
-                
-                album_group                 : list[dict] | str  = resp.get(ALBUM_GROUP)
-                if album_group:
-                    if isinstance(obj, Artist):
-                        album_entries = [a[ALBUM][0] for a in album_group if a.get(ALBUM)]
-                        for a in album_entries:                 ensure_uri(a, ALBUM)
-                        self.albums         : list[Album]       = obj.parse_relatives(album_entries, Album)
-                    elif isinstance(obj, Album):
-                        self.album_group    : str               = safe_typecast(resp, attr, str)
-                        self.needs_expansion = True
-                
-                appears_on                  : list[dict]        = resp.get(APPEARS_ON_GROUP)
-                if appears_on:
-                    appears_entries = [a[ALBUM][0] for a in appears_on if a.get(ALBUM)]
-                    for a in appears_entries:                   ensure_uri(a, ALBUM)
-                    self.appears_on         : list[Album]       = obj.parse_relatives(appears_entries, Album)
-                
-                artist                      : list[dict]        = resp.get(ARTIST)
-                artists                     : list[dict]        = resp.get(ARTISTS)
-                if artist or artists:
-                    artists = artist if artist else artists
-                    parent = isinstance(obj, (Track, Album))
-                    for i, a in enumerate(artists):             ensure_uri(a, ARTIST + str(i+1))
-                    self.artists            : list[Artist]      = obj.parse_relatives(artists, Artist, make_parent=parent)
-                
-                audio                       : list[dict]        = resp.get(AUDIO)
-                files                       : list[dict]        = resp.get(FILE)
-                alternatives                : list[dict]        = resp.get(ALTERNATIVE)
-                if any((audio, files, alternatives)):
-                    files = files if files is not None else audio
-                    if not files and alternatives:
-                        for alt in alternatives:
-                            files = alt.get(FILE)
-                            if files: break
-                    if files:
-                        self.is_playable = True
-                        self.file_ids = files
-                
-                biography                   : list[dict]        = resp.get(BIOGRAPHY)
-                if biography:
-                    self.biography          : str               = biography[0].get(TEXT)
-                
-                self.compilation            : bool              = self.album_type == COMPILATION if self.album_type else None
-                
-                contents                    : dict              = resp.get(CONTENTS) 
-                if contents:
-                    items                   : list[dict]        = contents.get(ITEMS)
-                    if items:
-                        for i, item in enumerate(items):
-                            attr: dict = item.pop(ATTRIBUTES, None)
-                            if attr is None: continue
-                            ensure_uri(item, TRACK + str(i+1))
-                            item[ADDED_AT] = timestamp_utc(attr.get(TIMESTAMP))
-                            item[ADDED_BY] = ensure_user_resp(attr.get(ADDED_BY))
-                            item[ITEM_ID] = attr.get(ITEM_ID)
-                        self.tracks_or_eps = obj.parse_relatives(items, (Track, Episode))
-                        self.needs_recursion = True
-                        if contents.get(TRUNCATED):
-                            self.needs_expansion = True
-                            Printer.hashtaged(PrintChannel.WARNING, f'PLAYLIST {self.name} MISSING FINAL {self.length - len(items)} ITEMS\n' +
-                                                                     'NOT RECOVERABLE WITHOUT A LEGACY DEVELOPER CLIENT')
-                
-                cover_group                 : dict              = resp.get(COVER_GROUP)
-                images                      : list[dict]        = resp.get(IMAGES)
-                if cover_group or images:
-                    covers = images if images else cover_group.get(IMAGE, [])
-                    largest_cover           : dict              = max(covers, key=lambda img: safe_typecast(img, WIDTH, int),
-                                                                  default={URL: None, FILE_ID: None})
-                    if largest_cover.get(FILE_ID):
-                        largest_cover[URL] = IMAGE_URL_PREFIX + Zotify.hex_id_from_file_id(largest_cover.get(FILE_ID))
-                    self.image_url          : str               = largest_cover.get(URL)
-                
-                date                        : dict              = resp.get(DATE)
-                if date and not self.release_date:
-                    self.release_date       : str               = "-".join(str(v) for v in date.values())
-                
-                discs                       : list[dict]        = resp.get(DISC)
-                if discs:
-                    track_entries           : list[dict]        = []
-                    for disc in discs:
-                        for i, t in enumerate(disc.get(TRACK, [])):
-                            ensure_uri(t, TRACK + str(i+1))
-                            t[DISC_NUMBER]  = disc.get(NUMBER)
-                            t[TRACK_NUMBER] = i + 1
-                        track_entries.extend(disc.get(TRACK, []))
-                    resp.update({TRACKS: {ITEMS: track_entries, NEXT: None}})
-                
-                episodes                    : dict              = resp.get(EPISODES)
-                if episodes:
-                    items                   : list[dict]        = episodes.get(ITEMS)
-                    if items:
-                        for i, e in enumerate(items):     ensure_uri(e, EPISODE + str(i+1))
-                        self.episodes       : list[Episode]     = obj.parse_relatives(items, Episode)
-                        self.needs_expansion = episodes[NEXT] is not None
-                    else:
-                        self.needs_expansion = True
-                
-                external_id                 : list[dict]        = resp.get(EXTERNAL_ID)
-                external_ids                : dict              = resp.get(EXTERNAL_IDS)
-                if external_id or external_ids:
-                    if external_id:
-                        external_ids = {eid.get(TYPE): eid.get(ID) for eid in external_id}
-                    self.ean                : str               = external_ids.get(EAN)
-                    self.isrc               : str               = external_ids.get(ISRC)
-                    self.upc                : str               = external_ids.get(UPC)
-                
-                owner_username              : str               = resp.get(OWNER_USERNAME)
-                if owner_username:
-                    resp[OWNER]                                 = ensure_user_resp(owner_username)
-                
-                owner                       : dict              = resp.get(OWNER)
-                if owner:
-                    self.owner              : User              = obj.parse_relatives([owner], User, make_parent=True)[0]
-                    self.owner.name                             = self.owner.display_name
-                
-                playlist_items              : dict              = resp.get(ITEMS)
-                if playlist_items and isinstance(obj, Playlist):
-                    self.length             : int               = resp.get(TOTAL)
-                    items                   : list[dict]        = playlist_items.get(ITEMS)
-                    if items:
-                        tracks_eps_empty = obj.unwrap(items)
-                        for i, t_or_e in enumerate(tracks_eps_empty):
-                            ensure_uri(t_or_e, TRACK + str(obj.ccount+i+1))
-                        self.tracks_or_eps = obj.parse_relatives(tracks_eps_empty, (Track, Episode))
-                        if not any(self.tracks_or_eps):
-                            Printer.hashtaged(PrintChannel.WARNING,
-                                              f'PLAYLIST "{self.name}" ({obj.uri})\n' +
-                                               '[Playlist.Items.Items] METADATA ENTIRELY ABSENT\n' +
-                                               'RECOMMENDED TO SET CONFIG "API_CLIENT_LEGACY = False"')
-                    else: # should never be called
-                        Printer.hashtaged(PrintChannel.WARNING,
-                                          f'PLAYLIST "{self.name}" ({obj.uri})\n' +
-                                           'HAS [Playlist.Items] BUT NO [Playlist.Items.Items]\n' +
-                                           'RECOMMENDED TO SET CONFIG "API_CLIENT_LEGACY = False"')
-                    self.needs_expansion = not items or playlist_items.get(NEXT) is not None
-                
-                publish_time                : dict[str, int]    = resp.get(PUBLISH_TIME)
-                if publish_time:
-                    dt = datetime(publish_time.get(YEAR), publish_time.get(MONTH), publish_time.get(DAY),
-                                  publish_time.get(HOUR, 0), publish_time.get(MINUTE, 0))
-                    self.publish_time = dt_to_str(dt)
-                    self.release_date = dt_to_str(dt.date())
-                
-                show                        : dict              = resp.get(SHOW)
-                if isinstance(obj, Episode) and isinstance(relative, Show):
-                    self.show               : Show              = relative
-                elif show:
-                    ensure_uri(show, SHOW)
-                    parent = isinstance(obj, Episode)
-                    self.show               : Show              = obj.parse_relatives([show], Show, make_parent=parent)[0]
-                
-                singles                     : list[dict]        = resp.get(SINGLE_GROUP)
-                if singles:
-                    single_entries = [a[ALBUM][0] for a in singles if a.get(ALBUM)]
-                    for a in single_entries:                    ensure_uri(a, ALBUM)
-                    self.singles            : list[Album]       = obj.parse_relatives(single_entries, Album)
-                
-                timestamp                   : str               = resp.get(TIMESTAMP)
-                if timestamp:
-                    self.timestamp          : str               = timestamp_utc(timestamp)
-                
-                followers                   : dict              = resp.get(FOLLOWERS)
-                if followers:
-                    self.followers          : int               = safe_typecast(followers, TOTAL, int)
-                
-                top_tracks                  : list[dict]        = resp.get(TOP_TRACK)
-                if top_tracks:
-                    track_entries = top_tracks[0].get(TRACK)
-                    if track_entries:
-                        for i, t in enumerate(track_entries):   ensure_uri(t, TRACK + str(i+1))
-                        self.top_tracks     : list[Track]       = obj.parse_relatives(track_entries, Track)
-                
-                tracks                      : dict              = resp.get(TRACKS)
-                if tracks and isinstance(obj, Album):
-                    items                   : list[dict]        = tracks.get(ITEMS)
-                    if items:
-                        for i, t in enumerate(items): ensure_uri(t, TRACK + str(obj.ccount+i+1))
-                        self.tracks: list[Track] = obj.parse_relatives(items, Track)
-                        self.needs_expansion = tracks.get(NEXT) is not None
-                        if not self.needs_expansion:
-                            # set in Album.grab_more_children() later if album incomplete
-                            self.total_discs = safe_typecast(items[-1], DISC_NUMBER, int)
-                            self.duration_ms = sum(int(t.duration_ms) if t.duration_ms else 0 for t in self.tracks)
-                    else:
-                        self.needs_expansion = True
-                
-                self.year                   : str               = self.release_date.split('-')[0] if self.release_date else None
-                
-                # hasMetadata must be last attribute set 
-                if isinstance(obj, (DLContent, Playlist, User, Show)):
-                    self.hasMetadata = bool(getattr(self, NAME, None))
-                elif isinstance(obj, Artist):
-                    self.all_albums = getattr(self, ALBUMS, []) + getattr(self, SINGLES, []) + getattr(self, APPEARS_ON, [])
-                    self.hasMetadata = bool(getattr(self, GENRES, None))
-                elif isinstance(obj, Album):
-                    self.hasMetadata = bool(getattr(self, TRACKS, None))
-        
-        for k, v in Metadata(self, resp).__dict__.items():
+        # the plan fills a dict rather than the object itself: handlers and finalizers read back fields set earlier
+        # in the same response, and what may overwrite an attribute depends on the whole response having been read
+        for k, v in self.parse_plan().parse(self, relative, resp).items():
             if v is None: continue
             elif k == ID and self.id != v:
                 Printer.debug(f"Updated {self.clsn} {self.name} ({self.uri}) ID to {self.id}")
@@ -427,7 +569,7 @@ class Content(HierarchicalNode):
             elif isinstance(self, Container) and k in self.__dict__ and getattr(self, k) == getattr(self, "_main_items"):
                 self._main_items.extend(v)
             elif relative and k in {ADDED_AT, ADDED_BY, ALBUM_GROUP}:
-                relational_attr: dict[Container, str | bool | User] = getattr(self, k)
+                relational_attr: dict[Container, str | bool | User] = self.own(k)
                 relational_attr.update({relative: v})
             elif not self.hasMetadata or getattr(self, k, None) is None:
                 setattr(self, k, v)
@@ -467,13 +609,14 @@ class Content(HierarchicalNode):
         return new_relatives
     
     def parse_uris_metadata(self, item_resps: list[dict], ContClass: type[Content],
-                            loader_text: str = None, hide_loader: bool = False) -> list[Content | Container]:
+                            loader_text: str = None, hide_loader: bool = False, expand: bool = True) -> list[Content | Container]:
+        """ expand=False leaves containers with only their first page of children, for Container.stream_children """
         if not item_resps: return []
         elif not loader_text: loader_text = ContClass.type_attr
         with Loader(f"Parsing {loader_text} information...", disabled=hide_loader):
             objs: list[Content | Container] = self.parse_relatives(item_resps, ContClass)
             
-            if not objs or not any(objs) or not isinstance(objs[0], Container):
+            if not objs or not any(objs) or not isinstance(objs[0], Container) or not expand:
                 return objs
             
             # missing children, only findale with Developer Client
@@ -487,13 +630,15 @@ class Content(HierarchicalNode):
                 recurs_children: list[Container] = []
                 for recurs_obj in recurs_objs:
                     recurs_children.extend(recurs_obj._main_items)
-                contains: tuple[type[Content], ...] = recurs_objs[0]._contains
-                for recurse_type in contains if isinstance(contains, tuple) else (contains,):
-                    recurse_uris = [item.uri for item in recurs_children if isinstance(item, recurse_type)]
-                    recurs_item_resps = self.fetch_uris_metadata(recurse_uris, recurse_type, hide_loader=True)
-                    _ = self.parse_uris_metadata(recurs_item_resps, recurse_type, hide_loader=True)
+                self.fetch_children_metadata(recurs_children, recurs_objs[0]._contains)
             return objs
     
+    def fetch_children_metadata(self, children: list[Content | None], contains: type[Content] | tuple[type[Content], ...]) -> None:
+        for recurse_type in contains if isinstance(contains, tuple) else (contains,):
+            recurse_uris = [item.uri for item in children if isinstance(item, recurse_type)]
+            recurs_item_resps = self.fetch_uris_metadata(recurse_uris, recurse_type, hide_loader=True)
+            _ = self.parse_uris_metadata(recurs_item_resps, recurse_type, hide_loader=True)
+    
     def check_skippable(self, parent_stack: ParentStack) -> bool:
         return False
     
@@ -503,31 +648,41 @@ class Content(HierarchicalNode):
         elif not isinstance(self, DLContent):
             self.downloaded = True
         elif path:
-            self.downloaded = True
-            parent_stack = ps if Zotify.CONFIG.get_optimized_dl() else ParentStack(ps.copy())
-            self.real_filepaths[parent_stack] = path
-            if not self.in_global_archive:
-                SongArchive().add_obj(self, path)
-            if isinstance(self, Track) and not self.id in SongArchive(path.parent).ids():
-                SongArchive(path.parent).add_obj(self, path)
+            with self._dl_lock:
+                self.downloaded = True
+                parent_stack = ps if Zotify.CONFIG.get_optimized_dl() else ParentStack(ps.copy())
+                self.own("real_filepaths")[parent_stack] = path
+                if not self.in_global_archive:
+                    SongArchive().add_obj(self, path)
+                if isinstance(self, Track) and not self.id in SongArchive(path.parent).ids():
+                    SongArchive(path.parent).add_obj(self, path)
 
 
 class DLContent(Content):
     _codec = ""
     _ext   = ""
+    real_filepaths  : dict[ParentStack, PurePath]   = NO_RELATIONS
+    _clone_to       : set[ParentStack]              = frozenset()
+    _cloning        : set[ParentStack]              = frozenset() # clones a worker has claimed but not yet copied
+    _abort          : Event                         = Event() # set when a multi-worker download is interrupted
     
     def __init__(self, uri: str):
         super().__init__(uri)
         self.dl_status = ""
         self.in_global_archive = self.id in SongArchive().ids()
-        self.real_filepaths: dict[ParentStack, PurePath] = {}
-        self._clone_to: set[ParentStack] = set()
         
         self.duration_ms    : int                   = None
         self.gid            : str                   = None
         self.is_playable    : bool                  = None
         
         self.file_ids       : list[dict[str, str]]  = None
+        self.cdn_source     : CdnSource             = None # set when a stream is resolved directly from the CDN
+    
+    @classmethod
+    def check_abort(cls) -> None:
+        """ Stop a worker's in-flight transfer at its next chunk once the download it belongs to was interrupted """
+        if cls._abort.is_set():
+            raise KeyboardInterrupt("Download aborted")
     
     def set_dl_status(self, str_status) -> Loader:
         self.dl_status = str_status
@@ -592,24 +747,25 @@ class DLContent(Content):
         
         return False
     
-    def fetch_content_stream(self, stream: Streamer, temppath: PurePath, parent_stack: ParentStack) -> str:
-        disable = Zotify.CONFIG.get_standard_interface() or not Zotify.CONFIG.get_show_download_pbar()
-        pbar = Printer.pbar(desc=str(self), total=stream.size, unit='B', unit_scale=True,
+    def iter_content_stream(self, stream: Streamer, parent_stack: ParentStack, offset: int = 0) -> Iterator[bytes | memoryview]:
+        disable = Zotify.CONFIG.get_standard_interface() or not Zotify.CONFIG.get_show_download_pbar() \
+                  or current_thread() is not main_thread() # concurrent byte pbars would fight over positions
+        pbar = Printer.pbar(desc=str(self), total=stream.size, initial=offset, unit='B', unit_scale=True,
                             unit_divisor=1024, disable=disable, pbar_stack=parent_stack.PBARS)
-        Path(temppath.parent).mkdir(parents=True, exist_ok=True)
         try:
-            with open(temppath, 'wb') as file:
-                no_responses = 0
-                time_start = time.time()
-                t_per_byte = (self.duration_ms / 1000. / stream.size * Zotify.CONFIG.get_dl_rate_limter()) if self.duration_ms else 0
-                while no_responses < 5:
-                    bytes_r = file.write(stream.stream().read(Zotify.CONFIG.get_chunk_size()))
-                    if bytes_r:
-                        pbar.update(bytes_r)
-                        time.sleep(bytes_r * t_per_byte)
-                    else:
-                        no_responses += 1
-                        time.sleep(0.05)
+            no_responses = 0
+            throttle = RateLimiter.bytes()
+            reader = AdaptiveReader(stream.stream(), Zotify.CONFIG.get_chunk_size(), Zotify.CONFIG.get_chunk_size_max())
+            while no_responses < 5 and stream.stream().available() > 0:
+                self.check_abort()
+                chunk = reader.read()
+                if chunk:
+                    yield chunk
+                    pbar.update(len(chunk))
+                    if throttle: throttle.consume(len(chunk))
+                else:
+                    no_responses += 1
+                    time.sleep(0.05)
                 # if Zotify.CONFIG.get_download_real_time():
                     #     elapsed_real = time.time() - time_start
                     #     elapsed_want = (pbar.n / stream.size) * (self.duration_ms/1000)
@@ -617,9 +773,82 @@ class DLContent(Content):
                     #     time.sleep(elapsed_want - elapsed_real)
         finally:
             pbar.close(); pbar.clear()
+    
+    def fetch_content_stream(self, stream: Streamer, temppath: PurePath, parent_stack: ParentStack) -> str:
+        Path(temppath.parent).mkdir(parents=True, exist_ok=True)
+        time_start = time.time()
+        partial = PartialDownload(temppath, self.id, stream.describe(), stream.size)
+        resume = partial.load()
+        if not resume and self.cdn_source and stream.size >= Zotify.CONFIG.get_range_fetch_threshold() \
+            and Zotify.CONFIG.get_range_fetch_parts() > 1 and not self.cdn_source.expired():
+            try:
+                self.fetch_content_ranges(stream, temppath, parent_stack)
+                return fmt_duration(time.time() - time_start)
+            except Exception as e:
+                Printer.hashtaged(PrintChannel.WARNING, str(e) + '\n' + 'PARALLEL RANGE FETCH FAILED\n' +
+                                                        'FALLING BACK TO SEQUENTIAL STREAM')
+        
+        written = 0
+        if resume:
+            position, written = resume
+            stream.stream().seek(position)
+            Printer.debug(f'Resuming Partial Download of "{self}" at Byte {written}')
+        
+        completed = False
+        with open(temppath, 'r+b' if resume else 'wb') as file:
+            file.truncate(written); file.seek(written)
+            try:
+                last_save = written
+                for chunk in self.iter_content_stream(stream, parent_stack, offset=written):
+                    written += file.write(chunk)
+                    if written - last_save >= Zotify.CONFIG.get_chunk_size_max():
+                        file.flush()
+                        partial.save(stream.stream().pos(), written)
+                        last_save = written
+                completed = True
+            finally:
+                if not completed and written:
+                    file.flush()
+                    partial.save(stream.stream().pos(), written)
+        partial.discard()
         
         return fmt_duration(time.time() - time_start)
     
+    def fetch_content_ranges(self, stream: Streamer, temppath: PurePath, parent_stack: ParentStack) -> None:
+        """ Fetch the rest of the stream's file as concurrent byte ranges directly from the CDN """
+        start = stream.stream().pos() # past any header librespot already skipped
+        disable = Zotify.CONFIG.get_standard_interface() or not Zotify.CONFIG.get_show_download_pbar() \
+                  or current_thread() is not main_thread()
+        pbar = Printer.pbar(desc=str(self), total=stream.size - start, unit='B', unit_scale=True,
+                            unit_divisor=1024, disable=disable, pbar_stack=parent_stack.PBARS)
+        pbar_lock = Lock()
+        throttle = RateLimiter.bytes()
+        def on_chunk(n: int):
+            self.check_abort()
+            with pbar_lock: pbar.update(n)
+            if throttle: throttle.consume(n)
+        
+        try:
+            self.cdn_source.fetch_ranges(start, stream.size, temppath, Zotify.CONFIG.get_range_fetch_parts(), on_chunk)
+        finally:
+            pbar.close(); pbar.clear()
+    
+    def pipe_content_stream(self, stream: Streamer, path: PurePath, parent_stack: ParentStack) -> str | None:
+        """ Transcode the stream as it downloads, returning None if the temp file route should be used instead """
+        Printer.logger(f'Piped Output Path: "{path}"\n' + 
+                       f'Desired Codec: {self._codec.upper()}', PrintChannel.DEBUG)
+        Path(path.parent).mkdir(parents=True, exist_ok=True)
+        with TranscodeFarm.slot():
+            time_start = time.time()
+            try:
+                pipe_ffm(self.iter_content_stream(stream, parent_stack), path,
+                         self.transcode_params() + Zotify.CONFIG.get_custom_ffmpeg_args())
+                return fmt_duration(time.time() - time_start)
+            except (ffmpy.FFExecutableNotFoundError, ffmpy.FFRuntimeError, OSError) as e:
+                Printer.hashtaged(PrintChannel.WARNING, str(e) + '\n' + 'STREAMING INTO FFMPEG FAILED\n' +
+                                                        'FALLING BACK TO TEMP FILE CONVERSION')
+                return
+    
     def get_audio_duration(self, path: PurePath) -> float:
         stdout = run_ffm(path, ["-show_entries", "format=duration"])
         duration = re.search(r'[\D]=([\d\.]*)', stdout).groups()[0]
@@ -629,7 +858,7 @@ class DLContent(Content):
         stdout = run_ffm(path, ["-show_entries", "stream=codec_name"])
         return stdout.split("=")[1].split("\r")[0].split("\n")[0]
     
-    def convert_audio_format(self, temppath: PurePath, path: PurePath) -> str | None:
+    def transcode_params(self) -> list[str]:
         output_params = ['-c:a', self._codec]
         if self._codec != 'copy':
             bitrate = Zotify.CONFIG.get_transcode_bitrate()
@@ -637,46 +866,65 @@ class DLContent(Content):
                 bitrate = Zotify.DOWNLOAD_BITRATE
             if bitrate:
                 output_params += ['-b:a', bitrate]
+            output_params += ['-threads', str(TranscodeFarm.thread_budget())]
+        return output_params
+    
+    def convert_audio_format(self, temppath: PurePath, path: PurePath) -> str | None:
+        output_params = self.transcode_params()
         Printer.logger(f'Temp Path: "{temppath}"\n' + 
                        f'Output Path: "{path}"\n' +
                        f'Desired Codec: {self._codec.upper()}\n' +
                        f'Expected Log Level: {Zotify.CONFIG.get_ffmpeg_log_level().upper()}', PrintChannel.DEBUG)
         
-        time_ffmpeg_start = time.time()
-        try:
-            run_ffm(temppath, None, path, output_params + Zotify.CONFIG.get_custom_ffmpeg_args())
-            return fmt_duration(time.time() - time_ffmpeg_start)
-        except ffmpy.FFExecutableNotFoundError:
-            Printer.hashtaged(PrintChannel.WARNING, 'FFMPEG NOT FOUND\n' +
-                                                   f'SKIPPING CONVERSION TO {self._codec.upper()}')
-            return
-        except Exception as e:
-            if Zotify.CONFIG.get_custom_ffmpeg_args():
-                Printer.hashtaged(PrintChannel.WARNING, str(e) + '\n' + 'CUSTOM FFMPEG ARGUMENTS FAILED')
-        
-        try:
-            run_ffm(temppath, None, path, output_params)
-            return fmt_duration(time.time() - time_ffmpeg_start)
-        except Exception as e:
-            Printer.hashtaged(PrintChannel.WARNING, str(e) + '\n' + f'SKIPPING CONVERSION TO {self._codec.upper()}')
-            return
+        with TranscodeFarm.slot():
+            time_ffmpeg_start = time.time()
+            try:
+                run_ffm(temppath, None, path, output_params + Zotify.CONFIG.get_custom_ffmpeg_args())
+                return fmt_duration(time.time() - time_ffmpeg_start)
+            except ffmpy.FFExecutableNotFoundError:
+                Printer.hashtaged(PrintChannel.WARNING, 'FFMPEG NOT FOUND\n' +
+                                                       f'SKIPPING CONVERSION TO {self._codec.upper()}')
+                return
+            except Exception as e:
+                if Zotify.CONFIG.get_custom_ffmpeg_args():
+                    Printer.hashtaged(PrintChannel.WARNING, str(e) + '\n' + 'CUSTOM FFMPEG ARGUMENTS FAILED')
+            
+            try:
+                run_ffm(temppath, None, path, output_params)
+                return fmt_duration(time.time() - time_ffmpeg_start)
+            except Exception as e:
+                Printer.hashtaged(PrintChannel.WARNING, str(e) + '\n' + f'SKIPPING CONVERSION TO {self._codec.upper()}')
+                return
     
     # placeholder func, overwrite in each child class
     def download(self, parent_stack: ParentStack):
         pass
     
+    # pipeline stages, child classes without separable stages download entirely in the stream stage
+    def stage_stream(self, parent_stack: ParentStack) -> DownloadJob | None:
+        self.download(parent_stack)
+    
+    def stage_convert(self, job: DownloadJob) -> DownloadJob:
+        return job
+    
+    def stage_tag(self, job: DownloadJob) -> None:
+        pass
+    
     def clone_file(self, parent_stack: ParentStack) -> bool:
         """ Attempt to clone and return if clone succeeded """
         if parent_stack.check_skippable():
             return False
-        clone_path = check_path_dupes(self.output_path(parent_stack))
         if not self.real_filepaths:
             Printer.hashtaged(PrintChannel.WARNING, f'ATTEMPT TO CLONE {self.clsn.upper()} "{self}" FAILED\n' + 
                                                      'FILE NOT YET DOWNLOADED, THIS SHOULD NOT HAPPEN')
         for filepath in self.real_filepaths.values():
             if not Path(filepath).exists(): continue
-            pathlike_move_safe(filepath, clone_path, copy=True)
-            self.mark_downloaded(parent_stack, clone_path)
+            clone_path = PathReservations.reserve(self.output_path(parent_stack))
+            try:
+                pathlike_move_safe(filepath, clone_path, copy=True)
+                self.mark_downloaded(parent_stack, clone_path)
+            finally:
+                PathReservations.release(clone_path)
             return True
         Printer.hashtaged(PrintChannel.WARNING, f'ATTEMPT TO CLONE {self.clsn.upper()} "{self}" FAILED\n' + 
                                                 f'FALLING BACK TO REDOWNLOAD\n' +
@@ -686,11 +934,17 @@ class DLContent(Content):
     
     def clone_to_all(self) -> bool:
         """ Attempt to clone all and return if all clones succeeded """
-        for ps in self._clone_to:
-            if ps in self.real_filepaths: continue
-            if not self.clone_file(ps):
-                return False
-        return True
+        with self._dl_lock: # only claiming targets is locked, other workers keep marking downloads during the copies
+            pending = [ps for ps in self._clone_to if ps not in self.real_filepaths and ps not in self._cloning]
+            self.own("_cloning", set).update(pending)
+        try:
+            for ps in pending:
+                if not self.clone_file(ps):
+                    return False
+            return True
+        finally:
+            with self._dl_lock:
+                self._cloning.difference_update(pending)
 
 
 class Track(DLContent):
@@ -700,6 +954,10 @@ class Track(DLContent):
     _codec = CODEC_MAP_TRACK.get(Zotify.CONFIG.get_download_format().lower(), "copy")
     _ext = EXT_MAP.get(Zotify.CONFIG.get_download_format().lower(), "ogg")
     _url = TRACK_URL
+    # only set by Playlist API or UserItem API
+    added_at        : dict[Container, str]  = NO_RELATIONS
+    # only set by Playlist API
+    added_by        : dict[Playlist, User]  = NO_RELATIONS
     
     def __init__(self, uri: str) -> None:
         super().__init__(uri)
@@ -714,11 +972,6 @@ class Track(DLContent):
         # only fetched if config set
         self.genres         : list[str]             = None
         self.lyrics         : list[str]             = None
-        
-        # only set by Playlist API or UserItem API
-        self.added_at       : dict[Container, str]  = {}
-        # only set by Playlist API
-        self.added_by       : dict[Playlist, User]  = {}
     
     def fill_output_template(self, parent_stack: ParentStack, output_template: str = "") -> PurePath:
         parent: Container = parent_stack[-2]
@@ -872,7 +1125,7 @@ class Track(DLContent):
             set_tag_safe(   ALBUM,          self.album.name)
             set_tag_safe(   ALBUMARTIST,    conv_artist_format(self.album.artists))
             set_tag_safe(   YEAR,           self.album.year)
-            img = requests.get(self.album.image_url).content if self.album.image_url else None
+            img = Zotify.http().get(self.album.image_url, timeout=Zotify.CONFIG.get_http_timeout()).content if self.album.image_url else None
             set_tag_safe(   ARTWORK,        img)
         
         # Unreliable Tags
@@ -912,7 +1165,7 @@ class Track(DLContent):
         jpg_path = jpg_album_cover_path if len(parent_stack) > 1 and isinstance(parent_stack[-2], Album) else jpg_single_path
         with open(jpg_path, 'wb') as f: f.write(img)
     
-    def download(self, parent_stack: ParentStack) -> None:
+    def stage_stream(self, parent_stack: ParentStack) -> DownloadJob | None:
         if not Zotify.CONFIG.get_optimized_dl():
             if Zotify.CONFIG.get_download_parent_album():
                 with Zotify.CONFIG.temporary_config(DOWNLOAD_PARENT_ALBUM, False):
@@ -933,34 +1186,62 @@ class Track(DLContent):
         
         Interface.bind(parent_stack)
         with self.set_dl_status("Preparing Download"):
-            path = check_path_dupes(self.output_path(parent_stack))
+            path = PathReservations.reserve(self.output_path(parent_stack)) # released once converted
             if path != self.output_path(parent_stack): # path exists but id isn't archived OR skipping disabled
                 Printer.debug('Path Duplicate Not Being Skipped:\n' +
                               'ID not Archived' if Zotify.CONFIG.get_skip_existing() else 'Skipping Disabled')
             temppath = path.with_suffix(".tmp")
             if Zotify.CONFIG.get_temp_download_dir():
-                temppath = Zotify.CONFIG.get_temp_download_dir() / f'zotify_{str(uuid4())}_{self.id}.tmp'
-        
-        stream = Zotify.get_content_stream(self)
-        if stream is None:
-            Printer.hashtaged(PrintChannel.ERROR, 'SKIPPING TRACK - FAILED TO GET CONTENT STREAM\n' +
-                                                 f'Track_ID: {self.id}')
-            return
+                temppath = Zotify.CONFIG.get_temp_download_dir() / f'zotify_{self.id}.tmp'
         
-        self.set_dl_status("Downloading Stream")
-        time_elapsed_dl = self.fetch_content_stream(stream, temppath, parent_stack)
-        
-        if not Zotify.CONFIG.get_always_check_lyrics():
-            self.fetch_lyrics(parent_stack)
-        
-        with self.set_dl_status("Converting File"):
-            create_download_directory(path.parent)
-            time_elapsed_ffmpeg = self.convert_audio_format(temppath, path) # temppath -> path here
-            if time_elapsed_ffmpeg is None:
-                path = pathlike_move_safe(temppath, path.with_suffix(".ogg"))
-            self.mark_downloaded(parent_stack, path)
-        
-        try: self.write_audio_tags(path, parent_stack)
+        handed_off = False
+        try:
+            wait_between_downloads()
+            stream = Zotify.get_content_stream(self)
+            if stream is None:
+                Printer.hashtaged(PrintChannel.ERROR, 'SKIPPING TRACK - FAILED TO GET CONTENT STREAM\n' +
+                                                     f'Track_ID: {self.id}')
+                return
+            
+            job = DownloadJob(parent_stack, path, temppath)
+            self.set_dl_status("Downloading Stream")
+            if Zotify.CONFIG.get_stream_to_ffmpeg() and self._codec != 'copy':
+                job.time_elapsed_ffmpeg = self.pipe_content_stream(stream, path, parent_stack)
+                job.converted = job.time_elapsed_ffmpeg is not None
+                job.time_elapsed_dl = job.time_elapsed_ffmpeg
+                if not job.converted:
+                    stream = Zotify.get_content_stream(self) # the failed attempt consumed the previous stream
+                    if stream is None:
+                        Printer.hashtaged(PrintChannel.ERROR, 'SKIPPING TRACK - FAILED TO GET CONTENT STREAM\n' +
+                                                             f'Track_ID: {self.id}')
+                        return
+            if not job.converted:
+                job.time_elapsed_dl = self.fetch_content_stream(stream, temppath, parent_stack)
+            
+            if not Zotify.CONFIG.get_always_check_lyrics():
+                self.fetch_lyrics(parent_stack)
+            handed_off = True
+            return job
+        finally:
+            if not handed_off: PathReservations.release(path)
+    
+    def stage_convert(self, job: DownloadJob) -> DownloadJob:
+        reserved_path = job.path
+        try:
+            with self.set_dl_status("Converting File"):
+                create_download_directory(job.path.parent)
+                if not job.converted:
+                    job.time_elapsed_ffmpeg = self.convert_audio_format(job.temppath, job.path) # temppath -> path here
+                    if job.time_elapsed_ffmpeg is None:
+                        job.path = pathlike_move_safe(job.temppath, job.path.with_suffix(".ogg"))
+                self.mark_downloaded(job.parent_stack, job.path)
+        finally:
+            PathReservations.release(reserved_path)
+        return job
+    
+    def stage_tag(self, job: DownloadJob) -> None:
+        path = job.path
+        try: self.write_audio_tags(path, job.parent_stack)
         except NotImplementedError as e:
             if not "Mutagen type" in e.args[0]: raise
             err_codec = e.args[0].removeprefix("Mutagen type ").removesuffix(" not implemented")
@@ -971,10 +1252,14 @@ class Track(DLContent):
             Printer.hashtaged(PrintChannel.ERROR, 'FAILED TO WRITE METADATA\n')
             Printer.traceback(e)
         
-        Interface.dl_complete(self, path, time_elapsed_dl, time_elapsed_ffmpeg)
+        Interface.dl_complete(self, path, job.time_elapsed_dl, job.time_elapsed_ffmpeg)
         
         if Zotify.CONFIG.get_optimized_dl(): self.clone_to_all()
-        wait_between_downloads()
+    
+    def download(self, parent_stack: ParentStack) -> None:
+        job = self.stage_stream(parent_stack)
+        if job is None: return
+        self.stage_tag(self.stage_convert(job))
     
     @staticmethod
     def read_audio_tags(filepath: PurePath) -> tuple[tuple, dict]:
@@ -1091,6 +1376,9 @@ class Episode(DLContent):
     _codec = CODEC_MAP_EPISODE.get(Zotify.CONFIG.get_download_format().lower(), "copy")
     _ext = EXT_MAP.get(Zotify.CONFIG.get_download_format().lower(), "copy")
     _url = EPISODE_URL
+    # only set by Playlist API
+    added_at        : dict[Playlist, str]   = NO_RELATIONS
+    added_by        : dict[Playlist, User]  = NO_RELATIONS
     
     def __init__(self, uri: str):
         super().__init__(uri)
@@ -1102,10 +1390,6 @@ class Episode(DLContent):
         self.publish_time           : str       = None
         self.release_date           : str       = None
         self.show                   : Show      = None
-        
-        # only set by Playlist API
-        self.added_at       : dict[Playlist, str]   = {}
-        self.added_by       : dict[Playlist, User]  = {}
     
     def fill_output_template(self, parent_stack: list[Container], output_template: str = "") -> PurePath:
         return self._path_root / fix_filename(self.show.name) / f"{self}.{self._ext}"
@@ -1124,19 +1408,26 @@ class Episode(DLContent):
             self.partner_url = direct_download_url
         return self.partner_url
     
-    def download_directly(self, path: PurePath) -> str:
+    def download_directly(self, path: PurePath, parent_stack: ParentStack) -> str:
         time_start = time.time()
         
-        r = requests.get(self.partner_url, stream=True, allow_redirects=True)
-        if r.status_code != 200:
-            r.raise_for_status()  # Will only raise for 4xx codes, so...
-            raise RuntimeError(f"Request to {self.partner_url} returned status code {r.status_code}")
-        file_size = int(r.headers.get('Content-Length', 0))
-        desc = "" if file_size else "(Unknown total file size)"
+        disable = Zotify.CONFIG.get_standard_interface() or not Zotify.CONFIG.get_show_download_pbar() \
+                  or current_thread() is not main_thread()
+        pbar = Printer.pbar(desc=str(self), unit='B', unit_scale=True, unit_divisor=1024,
+                            disable=disable, pbar_stack=parent_stack.PBARS)
+        def on_progress(done: int, total: int | None):
+            self.check_abort()
+            if pbar.total != total:
+                pbar.total = total
+                pbar.set_postfix_str("" if total else "(Unknown total file size)", refresh=False)
+            pbar.update(done - pbar.n)
         
         path = Path(path).expanduser().resolve()
-        with Printer.pbar_stream(r.raw, desc=desc, total=file_size) as f_stream:
-            pathlike_move_safe(f_stream, path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            PartnerClient.download(self.partner_url, path, on_progress)
+        finally:
+            pbar.close(); pbar.clear()
         
         time_dl_end = time.time()
         return fmt_duration(time_dl_end - time_start)
@@ -1153,60 +1444,64 @@ class Episode(DLContent):
         
         Interface.bind(parent_stack)
         with self.set_dl_status("Preparing Download"):
-            path = check_path_dupes(self.output_path(parent_stack))
+            path = PathReservations.reserve(self.output_path(parent_stack))
             if path != self.output_path(parent_stack): # path exists but id isn't archived OR skipping disabled
                 Printer.debug('Path Duplicate Not Being Skipped:\n' +
                               'ID not Archived' if Zotify.CONFIG.get_skip_existing() else 'Skipping Disabled')
             temppath = path.with_suffix(".tmp")
             if Zotify.CONFIG.get_temp_download_dir():
-                temppath = Zotify.CONFIG.get_temp_download_dir() / f'zotify_{str(uuid4())}_{self.id}.tmp'
-        
-        self.set_dl_status("Downloading Stream")
-        if not self.fetch_partner_url():
-            stream = Zotify.get_content_stream(self)
-            if stream is None:
-                Printer.hashtaged(PrintChannel.ERROR, 'SKIPPING EPISODE - FAILED TO GET CONTENT STREAM\n' +
-                                                     f'Episode_ID: {self.id}')
-                return
-            time_elapsed_dl = self.fetch_content_stream(stream, temppath, parent_stack)
-        else:
-            try:
-                time_elapsed_dl = self.download_directly(temppath)
-            except Exception as e:
-                Printer.hashtaged(PrintChannel.ERROR, 'FAILED TO DOWNLOAD EPISODE DIRECTLY')
-                Printer.traceback(e)
-                return
+                temppath = Zotify.CONFIG.get_temp_download_dir() / f'zotify_{self.id}.tmp'
         
+        reserved_path = path
         try:
-            with self.set_dl_status("Identifying Episode Audio Codec"):
-                codec = self.get_audio_codec(temppath)
-                ext = "." + EXT_MAP.get(codec, codec)
-            Printer.debug(f'Detected Codec: {codec}\n' +
-                          f'File Extension Matched to: {ext}')
-        except Exception as e:
-            # assume default codec since that's what the original library did
-            ext = ".mp3"
-            if isinstance(e, ffmpy.FFExecutableNotFoundError):
-                Printer.hashtaged(PrintChannel.WARNING, 'FFMPEG NOT FOUND\n'+
-                                                        'SKIPPING CODEC ANALYSIS - OUTPUT ASSUMED MP3')
+            wait_between_downloads()
+            self.set_dl_status("Downloading Stream")
+            if not self.fetch_partner_url():
+                stream = Zotify.get_content_stream(self)
+                if stream is None:
+                    Printer.hashtaged(PrintChannel.ERROR, 'SKIPPING EPISODE - FAILED TO GET CONTENT STREAM\n' +
+                                                         f'Episode_ID: {self.id}')
+                    return
+                time_elapsed_dl = self.fetch_content_stream(stream, temppath, parent_stack)
             else:
-                Printer.hashtaged(PrintChannel.WARNING, 'UNKNOWN ERROR\n' +
-                                                        'SKIPPING CODEC ANALYSIS - OUTPUT ASSUMED MP3')
-                Printer.traceback(e)
-        if path.suffix == ".copy":
-            path = path.with_suffix(ext)
-        
-        with self.set_dl_status("Converting File"):
-            create_download_directory(path.parent)
-            time_elapsed_ffmpeg = self.convert_audio_format(temppath, path)
-            if time_elapsed_ffmpeg is None:
-                path = pathlike_move_safe(temppath, path.with_suffix(ext))
-            self.mark_downloaded(parent_stack, path)
-        
-        Interface.dl_complete(self, path, time_elapsed_dl, time_elapsed_ffmpeg)
+                try:
+                    time_elapsed_dl = self.download_directly(temppath, parent_stack)
+                except Exception as e:
+                    Printer.hashtaged(PrintChannel.ERROR, 'FAILED TO DOWNLOAD EPISODE DIRECTLY')
+                    Printer.traceback(e)
+                    return
+            
+            try:
+                with self.set_dl_status("Identifying Episode Audio Codec"):
+                    codec = self.get_audio_codec(temppath)
+                    ext = "." + EXT_MAP.get(codec, codec)
+                Printer.debug(f'Detected Codec: {codec}\n' +
+                              f'File Extension Matched to: {ext}')
+            except Exception as e:
+                # assume default codec since that's what the original library did
+                ext = ".mp3"
+                if isinstance(e, ffmpy.FFExecutableNotFoundError):
+                    Printer.hashtaged(PrintChannel.WARNING, 'FFMPEG NOT FOUND\n'+
+                                                            'SKIPPING CODEC ANALYSIS - OUTPUT ASSUMED MP3')
+                else:
+                    Printer.hashtaged(PrintChannel.WARNING, 'UNKNOWN ERROR\n' +
+                                                            'SKIPPING CODEC ANALYSIS - OUTPUT ASSUMED MP3')
+                    Printer.traceback(e)
+            if path.suffix == ".copy":
+                path = path.with_suffix(ext)
+            
+            with self.set_dl_status("Converting File"):
+                create_download_directory(path.parent)
+                time_elapsed_ffmpeg = self.convert_audio_format(temppath, path)
+                if time_elapsed_ffmpeg is None:
+                    path = pathlike_move_safe(temppath, path.with_suffix(ext))
+                self.mark_downloaded(parent_stack, path)
+            
+            Interface.dl_complete(self, path, time_elapsed_dl, time_elapsed_ffmpeg)
+        finally:
+            PathReservations.release(reserved_path)
         
         if Zotify.CONFIG.get_optimized_dl(): self.clone_to_all()
-        wait_between_downloads()
 
 
 class Container(Content):
@@ -1226,18 +1521,31 @@ class Container(Content):
     def ccount(self):
         return len(self._main_items)
     
+    @property
+    def item_key(self) -> str:
+        return ITEMS if isinstance(self, Playlist) else self._contains.lowers
+    
+    def items_url(self, args: list[str] = []) -> str:
+        return f'{self._url}/{self.id}/{self.item_key.replace(" ", "-")}?{MARKET_APPEND}{arg_comb(self._fetch_args, *args)}'
+    
     def fetch_items(self, args: list[str] = [], hide_loader: bool = False) -> list[dict]:
-        item_key = ITEMS if isinstance(self, Playlist) else self._contains.lowers
-        with Loader(f'Fetching {self.type_attr} {item_key}...', disabled=hide_loader):
-            argstr = arg_comb(self._fetch_args, *args)
+        with Loader(f'Fetching {self.type_attr} {self.item_key}...', disabled=hide_loader):
             if self._nextable:
-                resp = Zotify.invoke_url_nextable(f'{self._url}/{self.id}/{item_key.replace(" ", "-")}?{MARKET_APPEND}{argstr}',
-                                                  params={LIMIT: self._fetch_q, OFFSET: self.ccount})
+                resp = Zotify.invoke_url_nextable(self.items_url(args), params={LIMIT: self._fetch_q, OFFSET: self.ccount},
+                                                  revalidate=True)
             else:
-                resp = Zotify.invoke_url(f'{self._url}/{self.id}/{item_key.replace(" ", "-")}?{MARKET_APPEND}{argstr}')
+                resp = Zotify.invoke_url(self.items_url(args), revalidate=True)
                 _, resp = resp.popitem()
             return resp
     
+    def iter_items(self, hide_loader: bool = False) -> Iterator[list[dict]]:
+        """ fetch_items one page at a time """
+        if not self._nextable:
+            yield self.fetch_items(hide_loader=hide_loader)
+            return
+        yield from Zotify.iter_url_nextable(self.items_url(), params={LIMIT: self._fetch_q, OFFSET: self.ccount},
+                                            revalidate=True)
+    
     def recurse_DLC(self) -> list[DLContent | None]:
         dlc = []
         for c in self._main_items:
@@ -1252,6 +1560,18 @@ class Container(Content):
         self._main_items.extend(item_objs)
         self.needs_expansion = False
     
+    def stream_children(self, hide_loader: bool = False) -> Iterator[list[DLContent | Container | None]]:
+        """ grab_more_children a page at a time, after first yielding the children already parsed """
+        if self._main_items:
+            yield list(self._main_items)
+        if not (self.needs_expansion and Zotify.CONFIG.permit_client_api()):
+            return
+        for item_resps in self.iter_items(hide_loader=hide_loader):
+            item_objs = self.parse_relatives(item_resps, self._contains)
+            self._main_items.extend(item_objs)
+            yield item_objs
+        self.needs_expansion = False
+    
     def pbar(self, items: list[DLContent | Container | None], ps: ParentStack) -> list[DLContent | Container]:
         real_items: list[DLContent | Container] = [c for c in items if c is not None]
         if not any(real_items): return []
@@ -1280,6 +1600,7 @@ class Playlist(Container):
     _preloaded = 100
     _fetch_q = 100
     _fetch_args = "additional_types=track%2Cepisode"
+    _ref_fields = f"{ITEMS}({ADDED_AT},{ADDED_BY},{IS_LOCAL},{ITEM}({TYPE},{URI})),{LIMIT},{NEXT},{OFFSET},{TOTAL}"
     _url = PLAYLIST_URL
     
     def __init__(self, uri: str):
@@ -1309,8 +1630,77 @@ class Playlist(Container):
             track_or_ep[IS_LOCAL] = item.get(IS_LOCAL)
         return tracks_eps_empty
     
+    def parse_metadata(self, relative: Content | None, resp: dict):
+        self.sync_items(resp)
+        super().parse_metadata(relative, resp)
+    
+    def sync_items(self, resp: dict):
+        """ Swap in the item list of the last sync if the snapshot is unchanged, otherwise
+            note what fetch_items needs to record the new snapshot once every page is in """
+        snapshot_id: str = resp.get(SNAPSHOT_ID)
+        page: dict = resp.get(ITEMS)
+        if not snapshot_id or not isinstance(page, dict) or page.get(ITEMS) is None:
+            return
+        
+        record = PlaylistSync.get(self.id)
+        if record and record[0] == snapshot_id:
+            page[ITEMS] = record[1]
+            page[NEXT] = None
+        elif page.get(NEXT) is None:
+            PlaylistSync.put(self.id, snapshot_id, page[ITEMS], page.get(TOTAL))
+        else:
+            # parsing mutates the page, so keep a copy of it for the record
+            self._sync_pending = (snapshot_id, deepcopy(page[ITEMS]), record[1] if record else None, page.get(TOTAL))
+    
+    def fetch_changed_items(self, synced_items: list[dict], hide_loader: bool = False) -> list[dict] | None:
+        """ Page through item references only, taking each item's metadata from the last sync or, for items
+            it did not contain, from the metadata endpoints. None if the items can't be rebuilt this way """
+        known: dict[str, dict] = {entry[ITEM][URI]: entry[ITEM] for entry in synced_items if entry.get(ITEM) and entry[ITEM].get(URI)}
+        with Loader(f'Fetching {self.type_attr} {ITEMS}...', disabled=hide_loader):
+            refs: list[dict] = Zotify.invoke_url_nextable(f'{self._url}/{self.id}/{ITEMS}?{MARKET_APPEND}{arg_comb(self._fetch_args)}',
+                                                          params={LIMIT: self._fetch_q, OFFSET: self.ccount,
+                                                                  FIELDS: self._ref_fields}, revalidate=True)
+        
+        missing: dict[type[DLContent], list[str]] = {}
+        for ref in refs:
+            item: dict | None = ref.get(ITEM)
+            if item is None or ref.get(IS_LOCAL) or not item.get(URI):
+                return None # local files and unavailable items only come in full from the item listing
+            if item[URI] not in known:
+                missing.setdefault(Episode if item.get(TYPE) == EPISODE else Track, []).append(item[URI])
+        for ItemClass, uris in missing.items():
+            resps = self.fetch_uris_metadata(uris, ItemClass, hide_loader=True)
+            if not all(resps):
+                return None
+            known.update(zip(uris, resps))
+        return [ref | {ITEM: deepcopy(known[ref[ITEM][URI]])} for ref in refs]
+    
     def fetch_items(self, hide_loader: bool = False) -> list[dict | None]:
-        return self.unwrap( super().fetch_items(hide_loader=hide_loader) )
+        pending: tuple[str, list[dict], list[dict] | None, int | None] | None = self.__dict__.pop("_sync_pending", None)
+        if pending is None:
+            return self.unwrap( super().fetch_items(hide_loader=hide_loader) )
+        
+        snapshot_id, first_items, synced_items, total = pending
+        items = self.fetch_changed_items(synced_items, hide_loader) if synced_items else None
+        if items is None:
+            items = super().fetch_items(hide_loader=hide_loader)
+        PlaylistSync.put(self.id, snapshot_id, first_items + items, total)
+        return self.unwrap(items)
+    
+    def iter_items(self, hide_loader: bool = False) -> Iterator[list[dict | None]]:
+        pending: tuple[str, list[dict], list[dict] | None, int | None] | None = self.__dict__.get("_sync_pending")
+        if pending is not None and pending[2]:
+            # rebuilding from the last sync is already a fraction of a full listing
+            yield self.fetch_items(hide_loader=hide_loader)
+            return
+        
+        self.__dict__.pop("_sync_pending", None)
+        items: list[dict] = []
+        for page in super().iter_items(hide_loader=hide_loader):
+            if pending is not None: items.extend(deepcopy(page))
+            yield self.unwrap(page)
+        if pending is not None:
+            PlaylistSync.put(self.id, pending[0], pending[1] + items, pending[3])
 
 
 class User(Container):
@@ -1326,10 +1716,30 @@ class User(Container):
     def fetch_display_name(cls, username: str) -> str:
         display_name = cls._display_name_map.get(username)
         if display_name: return display_name
-        
-        user_profile = Zotify.get_user_profile(username)
-        cls._display_name_map[username] = user_profile.get(NAME, username)
-        return cls._display_name_map[username]
+        return cls.fetch_display_names([username])[username]
+    
+    @classmethod
+    def fetch_display_names(cls, usernames: Iterable[str]) -> dict[str, str]:
+        """ Resolve many display names at once, from memory, then the metadata cache,
+            then concurrent profile lookups for the rest """
+        usernames = [u for u in dict.fromkeys(usernames) if u]
+        wanted = [u for u in usernames if u not in cls._display_name_map]
+        if wanted:
+            profiles = MetadataCache.get_many(cls, wanted, "profile")
+            missing = [u for u in wanted if u not in profiles]
+            if missing:
+                lookup = lambda u: SingleFlight.do((USER, u), Zotify.get_user_profile, u)
+                if len(missing) == 1:
+                    fetched = {missing[0]: lookup(missing[0])}
+                else:
+                    with ThreadPoolExecutor(min(len(missing), Zotify.CONFIG.get_api_concurrency()),
+                                            thread_name_prefix="zotify-api") as executor:
+                        fetched = dict(zip(missing, executor.map(lookup, missing)))
+                MetadataCache.put_many(cls, fetched, "profile") # failed lookups come back empty and are skipped
+                profiles |= fetched
+            for u in wanted:
+                cls._display_name_map[u] = (profiles.get(u) or {}).get(NAME, u)
+        return {u: cls._display_name_map[u] for u in usernames}
 
 
 class Album(Container):
@@ -1340,6 +1750,10 @@ class Album(Container):
     _contains = Track
     _preloaded = 50
     _url = ALBUM_URL
+    # only set by Artist Albums API
+    album_group     : dict[Container, str]  = NO_RELATIONS
+    # only set by UserItem API
+    added_at        : dict[Container, str]  = NO_RELATIONS
     
     def __init__(self, uri: str):
         super().__init__(uri)
@@ -1357,17 +1771,18 @@ class Album(Container):
         self.year           : str                   = None
         self.artists        : list[Artist]          = None
         self.tracks         : list[Track]           = self._main_items
-        
-        # only set by Artist Albums API
-        self.album_group    : dict[Container, str]  = {}
-        # only set by UserItem API
-        self.added_at       : dict[Container, str]  = {}
     
     def grab_more_children(self, hide_loader: bool = False) -> list[dict]:
         super().grab_more_children(hide_loader=hide_loader)
         self.total_discs = str(self.tracks[-1].disc_number)
         self.duration_ms = sum((int(t.duration_ms) for t in self.tracks))
     
+    def stream_children(self, hide_loader: bool = False) -> Iterator[list[Track | None]]:
+        # disc and duration totals are tagged into every track, so they have to be complete first
+        if self.needs_expansion and Zotify.CONFIG.permit_client_api():
+            self.grab_more_children(hide_loader=hide_loader)
+        yield list(self._main_items)
+    
     def check_skippable(self, parent_stack: ParentStack) -> bool:
         discog_artist = next((p for p in parent_stack if isinstance(p, Artist)), None)
         album_group = self.album_group.get(discog_artist, getattr(discog_artist, APPEARS_ON, None))
@@ -1505,6 +1920,18 @@ class ParentStack(list):
         self[-1].download(self)
 
 
+class DownloadJob:
+    """ State handed between the stream, convert, and tag stages of a single DLContent download """
+    
+    def __init__(self, parent_stack: ParentStack, path: PurePath, temppath: PurePath):
+        self.parent_stack       : ParentStack   = parent_stack
+        self.path               : PurePath      = path
+        self.temppath           : PurePath      = temppath
+        self.time_elapsed_dl    : str | None    = None
+        self.time_elapsed_ffmpeg: str | None    = None
+        self.converted          : bool          = False # transcoded while streaming, no temp file to convert
+
+
 class Query(Container):
     _root_node = True
     _show_pbar = Zotify.CONFIG.get_show_url_pbar()
@@ -1532,20 +1959,22 @@ class Query(Container):
             item_resps_by_type.append(self.fetch_uris_metadata(uris, cont_type))
         return item_resps_by_type
     
-    def parse_query_metadata(self, item_resps_by_type: list[list[dict]], item_types: list[type[Content]] = ITEM_BULK_FETCH) -> None:
+    def parse_query_metadata(self, item_resps_by_type: list[list[dict]], item_types: list[type[Content]] = ITEM_BULK_FETCH,
+                             expand: bool = True) -> None:
         """ Writes list[list[Content]] to self.requested_objs """
         for item_resps, item_type in zip(item_resps_by_type, item_types):
-            self.requested_objs.append(self.parse_uris_metadata(item_resps, item_type))
+            self.requested_objs.append(self.parse_uris_metadata(item_resps, item_type, expand=expand))
         return self.requested_objs
     
-    def fetch_extra_metadata(self):
-        alltracks = {t for t in self.ALL_NODES if isinstance(t, Track) and not t.is_local}
+    def fetch_extra_metadata(self, tracks: set[Track] | None = None, hide_loader: bool = False):
+        """ Genres and album totals for tracks, by default every track in the query """
+        alltracks = tracks if tracks is not None else {t for t in self.ALL_NODES if isinstance(t, Track) and not t.is_local}
         
         artists = set().union(*(set(track.artists) for track in alltracks))
         artist_uris: dict[str, Artist] = {a.uri: a for a in artists if not a.is_local and not a.hasMetadata
                                           and not "".join(a.name.lower().split()) == "variousartists"}
         if Zotify.CONFIG.get_save_genres() and artist_uris:
-            artist_resps = self.fetch_uris_metadata(artist_uris.keys(), Artist, loader_text=GENRE)
+            artist_resps = self.fetch_uris_metadata(artist_uris.keys(), Artist, loader_text=GENRE, hide_loader=hide_loader)
             for artist, artist_resp in zip(artist_uris.values(), artist_resps):
                 artist.parse_metadata(None, artist_resp)
                 artist.needs_expansion = False
@@ -1558,14 +1987,15 @@ class Query(Container):
         album_uris: dict[str, Album] = {a.uri: a for a in albums if not a.hasMetadata}
         if (Zotify.CONFIG.get_disc_track_totals() or Zotify.CONFIG.get_download_parent_album()) and albums:
             loader_text = "parent album" if Zotify.CONFIG.get_download_parent_album() else "track/disc total"
-            album_resps = self.fetch_uris_metadata(album_uris.keys(), Album, loader_text=loader_text)
+            album_resps = self.fetch_uris_metadata(album_uris.keys(), Album, loader_text=loader_text, hide_loader=hide_loader)
             for album, album_resp in zip(album_uris.values(), album_resps):
                 album.parse_metadata(None, album_resp)
                 if album.needs_expansion:
                     album.grab_more_children(hide_loader=True)
                 if album.needs_recursion:
-                    track_resps = self.fetch_uris_metadata([t.uri for t in album.tracks], Track, loader_text=loader_text)
-                    album.parse_uris_metadata(track_resps, Track, loader_text=loader_text)
+                    track_resps = self.fetch_uris_metadata([t.uri for t in album.tracks], Track, loader_text=loader_text,
+                                                           hide_loader=hide_loader)
+                    album.parse_uris_metadata(track_resps, Track, loader_text=loader_text, hide_loader=hide_loader)
     
     def create_m3u8_playlists(self) -> None:
         for obj_list, cont_type in zip(self.requested_objs, ITEM_BULK_FETCH):
@@ -1591,46 +2021,94 @@ class Query(Container):
                         filepaths.append(dlc.real_filepaths.get(ps))
                 M3U8(filepaths, cont_type, obj).write(dlcs, filepaths)
     
-    def download(self):
-        self._main_items = [c for content_type in self.requested_objs for c in content_type]
-        if Zotify.CONFIG.get_optimized_dl():
-            def build_parent_stacks(c: DLContent | Container) -> list[ParentStack]:
-                if not isinstance(c, Container): return [[c]]
-                return (ParentStack([c] + cs) for i in c._main_items for cs in build_parent_stacks(i))
-            
-            dlc_mapping: dict[DLContent, list[ParentStack]] = {}
-            for ps in build_parent_stacks(self):
-                dlc: DLContent | None = ps[-1]
-                if dlc is None: continue
-                elif dlc not in dlc_mapping: dlc_mapping[dlc] = [ps]
-                else: dlc_mapping[dlc].append(ps)
-            
-            if Zotify.CONFIG.get_download_parent_album():
-                tracks_with_albums: set[Track] = {t for t in dlc_mapping if isinstance(t, Track) and t.album}
-                for t in tracks_with_albums: dlc_mapping[dlc].append(ParentStack([self, t.album, t]))
-            
-            downloadables = set()
-            for dlc, pss in dlc_mapping.items():
-                nonskipped = [ps for ps in pss if not ps.check_skippable()] # handles already downloaded
-                if not nonskipped: continue
-                downloadables.add(nonskipped.pop()) # prioritize parent album entry if present
-                dlc._clone_to.update(nonskipped)
-            
-            downloadables = edge_zip(sorted(downloadables, key=lambda c: getattr(c[-1], DURATION_MS, 0)))
-            if Zotify.CONFIG.get_download_parent_album():
-                downloadables = sorted(downloadables, key=lambda c: getattr(getattr(c, ALBUM, Album("")), URI))
-            self._main_items = downloadables
-        
-        if Zotify.CONFIG.get_standard_interface():
+    @staticmethod
+    def build_parent_stacks(c: DLContent | Container) -> list[ParentStack]:
+        if not isinstance(c, Container): return [[c]]
+        return (ParentStack([c] + cs) for i in c._main_items for cs in Query.build_parent_stacks(i))
+    
+    def assign_downloads(self, parent_stacks: Iterable[ParentStack], assigned: set[DLContent]) -> list[ParentStack]:
+        """ One ParentStack to download each DLContent through, ordered for downloading. The DLContent's other
+            ParentStacks get a copy of its file, as do all of them for DLContent already in assigned """
+        dlc_mapping: dict[DLContent, list[ParentStack]] = {}
+        for ps in parent_stacks:
+            dlc: DLContent | None = ps[-1]
+            if dlc is None: continue
+            elif dlc not in dlc_mapping: dlc_mapping[dlc] = [ps]
+            else: dlc_mapping[dlc].append(ps)
+        
+        if Zotify.CONFIG.get_download_parent_album():
+            tracks_with_albums: set[Track] = {t for t in dlc_mapping if isinstance(t, Track) and t.album}
+            for t in tracks_with_albums: dlc_mapping[t].append(ParentStack([self, t.album, t]))
+        
+        downloadables = []
+        for dlc, pss in dlc_mapping.items():
+            nonskipped = [ps for ps in pss if not ps.check_skippable()] # handles already downloaded
+            if not nonskipped: continue
+            if dlc not in assigned:
+                downloadables.append(nonskipped.pop()) # prioritize parent album entry if present
+                assigned.add(dlc)
+            with dlc._dl_lock: # download workers may be cloning this DLContent already
+                dlc.own("_clone_to", set).update(nonskipped)
+        
+        downloadables = edge_zip(sorted(downloadables, key=lambda c: getattr(c[-1], DURATION_MS, 0)))
+        if Zotify.CONFIG.get_download_parent_album():
+            downloadables = sorted(downloadables, key=lambda c: getattr(getattr(c, ALBUM, Album("")), URI))
+        return downloadables
+    
+    def stream_downloads(self, assigned: set[DLContent]) -> Iterator[list[ParentStack]]:
+        """ assign_downloads a page of requested content at a time, starting with the requested DLContent,
+            each page's children and extra metadata resolved before it is handed out """
+        requested: list[DLContent | Container] = [c for content_type in self.requested_objs for c in content_type if c]
+        pages: list[tuple[list[Content], Iterable[list[Content | None]]]] = \
+            [([self], [[c for c in requested if not isinstance(c, Container)]])]
+        pages += [([self, c], c.stream_children(hide_loader=True)) for c in requested if isinstance(c, Container)]
+        
+        for prefix, children_pages in pages:
+            container: Container | None = prefix[-1] if prefix[-1] is not self else None
+            for children in children_pages:
+                if container and container.needs_recursion:
+                    self.fetch_children_metadata(children, container._contains)
+                parent_stacks = [ParentStack(prefix + cs) for c in children for cs in self.build_parent_stacks(c)]
+                self.fetch_extra_metadata({ps[-1] for ps in parent_stacks if isinstance(ps[-1], Track) and not ps[-1].is_local},
+                                          hide_loader=True)
+                if Zotify.CONFIG.get_standard_interface():
+                    Interface.ALL_DLCONTENT = Interface.ALL_DLCONTENT | {ps[-1] for ps in parent_stacks if ps[-1]}
+                yield self.assign_downloads(parent_stacks, assigned)
+            if container: container.needs_recursion = False
+    
+    def download(self, stream: bool = False):
+        """ stream=True starts downloading while stream_downloads is still resolving later pages """
+        if Zotify.CONFIG.get_standard_interface(): # before stream_downloads starts adding nodes
             Interface.ALL_DLCONTENT = {n for n in self.ALL_NODES if isinstance(n, DLContent)}
             Interface.refresh()
         
+        assigned: set[DLContent] = set()
+        self._main_items = [c for content_type in self.requested_objs for c in content_type]
+        if stream:
+            self._main_items = BackgroundFeed(self.stream_downloads(assigned), name="zotify-metadata")
+        elif Zotify.CONFIG.get_optimized_dl():
+            self._main_items = self.assign_downloads(self.build_parent_stacks(self), assigned)
+        
         interrupt = None
-        try: super().download(ParentStack([self]))
+        DLContent._abort.clear()
+        try:
+            if Zotify.CONFIG.get_optimized_dl() and Zotify.CONFIG.get_download_pipeline():
+                self.download_pipelined(ParentStack([self]))
+            elif Zotify.CONFIG.get_optimized_dl() and Zotify.CONFIG.get_download_workers() > 1:
+                self.download_concurrently(ParentStack([self]))
+            else:
+                super().download(ParentStack([self]))
+            if stream: # copies for ParentStacks streamed in after their DLContent had finished
+                for dlc in assigned:
+                    if dlc.downloaded and dlc._clone_to: dlc.clone_to_all()
         except BaseException as e:
             interrupt = e
             traceback = e.__traceback__
         
+        if stream:
+            self._main_items.close()
+            self._main_items = self._main_items.items
+        
         while Printer.ACTIVE_LOADER:
             Printer.ACTIVE_LOADER.stop()
         n_pbars = len(Printer.ACTIVE_PBARS)
@@ -1659,11 +2137,103 @@ class Query(Container):
                 Printer.logger(self.__dict__, PrintChannel.ERROR)
                 raise interrupt.with_traceback(traceback)
     
+    def pbar(self, items: list[ParentStack | Container | None] | BackgroundFeed, ps: ParentStack) -> Iterator[ParentStack | Container]:
+        if isinstance(items, BackgroundFeed):
+            pbar = self.feed_pbar(items, ps)
+            items = items.items
+        else:
+            pbar = super().pbar(items, ps)
+            items = [c for c in items if c is not None]
+        if not (Zotify.CONFIG.get_optimized_dl() and Zotify.CONFIG.get_prefetch_ahead()):
+            return pbar
+        return self.prefetching(pbar, items)
+    
+    def feed_pbar(self, feed: BackgroundFeed, ps: ParentStack) -> Iterator[ParentStack]:
+        """ Progress over a feed still being produced, its total growing as later pages resolve """
+        pbar = Printer.pbar(desc=self.name, total=1, unit="Content", default_pos=7,
+                            disable=not self._show_pbar, pbar_stack=ps.PBARS)
+        ps.PBARS.append(pbar)
+        for item in feed:
+            pbar.total = len(feed) + (not feed.finished) # only reach the total once the feed is done
+            yield item
+            pbar.update()
+        pbar.total = pbar.n
+        pbar.refresh()
+    
+    @staticmethod
+    def prefetching(pbar: list[ParentStack], items: list[ParentStack]) -> Iterator[ParentStack]:
+        """ Resolve CDN sources for the next PREFETCH_AHEAD tracks as each item is handed out """
+        ahead = Zotify.CONFIG.get_prefetch_ahead()
+        try:
+            for i, ps in enumerate(pbar):
+                CdnPrefetcher.schedule([c[-1] for c in items[i+1:i+1+ahead] if isinstance(c, ParentStack)
+                                        and isinstance(c[-1], Track) and not c.check_skippable()])
+                yield ps
+        finally:
+            CdnPrefetcher.clear()
+    
+    def download_concurrently(self, parent_stack: ParentStack):
+        """ Drain the deduplicated ParentStacks built in optimized mode with a pool of download workers """
+        n_workers = Zotify.CONFIG.get_download_workers()
+        executor = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="zotify-dl")
+        in_flight: set[Future] = set()
+        
+        def reap(futures: set[Future]):
+            for future in futures:
+                future.result() # reraise any worker exception in the main thread
+        
+        try:
+            for ps in self.pbar(self._main_items, parent_stack):
+                if len(in_flight) >= n_workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    reap(done)
+                    Printer.refresh_all_pbars(parent_stack.PBARS)
+                in_flight.add(executor.submit(ps.download, parent_stack))
+            done, in_flight = wait(in_flight)
+            reap(done)
+        except BaseException:
+            DLContent._abort.set() # running workers stop at their next chunk instead of finishing their files
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        Printer.refresh_all_pbars(parent_stack.PBARS, skip_pop=True)
+        self.mark_downloaded()
+    
+    def download_pipelined(self, parent_stack: ParentStack):
+        """ Overlap streaming, converting, and tagging of consecutive items in optimized mode """
+        def stream(ps: ParentStack) -> DownloadJob | None:
+            if ps[-1] is None: return ps.download(parent_stack)
+            return ps[-1].stage_stream(ps)
+        
+        pipeline = StagedPipeline([("stream",  stream,                                          Zotify.CONFIG.get_download_workers()),
+                                   ("convert", lambda job: job.parent_stack[-1].stage_convert(job), TranscodeFarm.parallel_encodes()),
+                                   ("tag",     lambda job: job.parent_stack[-1].stage_tag(job),     1)])
+        try:
+            pipeline.run(self.pbar(self._main_items, parent_stack), on_feed=lambda: Printer.refresh_all_pbars(parent_stack.PBARS))
+        except BaseException:
+            DLContent._abort.set()
+            raise
+        Printer.refresh_all_pbars(parent_stack.PBARS, skip_pop=True)
+        
+        Printer.hashtaged(PrintChannel.DOWNLOADS, 'DOWNLOAD PIPELINE STAGE UTILIZATION\n' +
+                                                  "\n".join(f'{name.upper()}: {util:.0%}' for name, util in pipeline.utilization().items()))
+        self.mark_downloaded()
+    
     def reset(self):
         HierarchicalNode.ALL_NODES = {}
         ParentStack.PBARS = []
     
+    def stream_execute(self):
+        """ execute with each container's pages parsed and downloaded as they arrive, see stream_downloads """
+        self.reset()
+        with Loader("Fetching metadata..."):
+            self.parse_query_metadata(self.fetch_query_metadata(), expand=False)
+        self.download(stream=True)
+    
     def execute(self):
+        if Zotify.CONFIG.get_stream_metadata():
+            self.stream_execute()
+            return
         self.reset()
         self.parse_query_metadata(self.fetch_query_metadata())
         self.fetch_extra_metadata()
@@ -1735,7 +2305,8 @@ class UserItem(Query):
     
     def fetch_user_items(self) -> list[dict]:
         with Loader(f"Fetching {self.name}...", disabled=self._interactive):
-            user_item_resps = Zotify.invoke_url_nextable(f"{self._url}?{MARKET_APPEND}", stripper=self._outer_stripper)
+            user_item_resps = Zotify.invoke_url_nextable(f"{self._url}?{MARKET_APPEND}", stripper=self._outer_stripper,
+                                                         revalidate=True)
         return user_item_resps
     
     def display_select_user_items(self, user_item_resps: list[dict]) -> list[dict]:
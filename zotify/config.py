@@ -1,9 +1,11 @@
 import json
 import logging
+import os
 import sys
 import re
 import requests
 from binascii import hexlify
+from concurrent.futures import ThreadPoolExecutor
 from base64 import b64encode, b64decode
 from contextlib import contextmanager
 from datetime import datetime
@@ -12,12 +14,13 @@ from google.protobuf.json_format import MessageToDict, ParseDict
 from librespot import metadata
 from librespot.audio import FeederException, CdnManager, CdnFeedHelper
 from librespot.audio.decoders import AudioQuality, SuperAudioFormat, FormatOnlyAudioQuality
-from librespot.core import Session, OAuth, MercuryRequests
+from librespot.core import ApiClient, Session, OAuth, MercuryRequests
 from librespot.proto.Authentication_pb2 import AuthenticationType
 from librespot.proto.Metadata_pb2 import AudioFile
 from pathlib import Path, PurePath
-from time import sleep
-from typing import Any, Callable
+from time import sleep, time
+from typing import Any, Callable, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from zotify.const import *
 from zotify.termoutput import Printer, PrintChannel, Loader
@@ -53,6 +56,14 @@ CONFIG_VALUES = {
     OPTIMIZED_DOWNLOADING:      { 'default': 'True',                    'type': bool,   'arg': ('--optimized-downloading'                ,) },
     DOWNLOAD_RATE_LIMITER:      { 'default': '0.0',                     'type': float,  'arg': ('-dlr', '--download-rate-limiter'       ,) },
     BULK_WAIT_TIME:             { 'default': '1.0',                     'type': float,  'arg': ('--bulk-wait-time'                       ,) },
+    DOWNLOAD_WORKERS:           { 'default': '1',                       'type': int,    'arg': ('--download-workers'                     ,) },
+    DOWNLOAD_PIPELINE:          { 'default': 'False',                   'type': bool,   'arg': ('--download-pipeline'                    ,) },
+    TRANSCODE_WORKERS:          { 'default': '0',                       'type': int,    'arg': ('--transcode-workers'                    ,) },
+    STREAM_TO_FFMPEG:           { 'default': 'False',                   'type': bool,   'arg': ('--stream-to-ffmpeg'                     ,) },
+    RANGE_FETCH_PARTS:          { 'default': '1',                       'type': int,    'arg': ('--range-fetch-parts'                    ,) },
+    RANGE_FETCH_THRESHOLD:      { 'default': '20971520',                'type': int,    'arg': ('--range-fetch-threshold'                ,) },
+    PARTNER_HOST_CONNECTIONS:   { 'default': '4',                       'type': int,    'arg': ('--partner-host-connections'             ,) },
+    PREFETCH_AHEAD:             { 'default': '0',                       'type': int,    'arg': ('--prefetch-ahead'                       ,) },
     TEMP_DOWNLOAD_DIR:          { 'default': '',                        'type': str,    'arg': ('-td', '--temp-download-dir'             ,) },
     
     # Album/Artist Options
@@ -113,7 +124,15 @@ CONFIG_VALUES = {
     API_CLIENT_LEGACY:          { 'default': 'True',                    'type': bool,   'arg': ('--client-legacy'                        ,) },
     RETRY_ATTEMPTS:             { 'default': '1',                       'type': int,    'arg': ('--retry-attempts'                       ,) },
     CHUNK_SIZE:                 { 'default': '20000',                   'type': int,    'arg': ('--chunk-size'                           ,) },
+    CHUNK_SIZE_MAX:             { 'default': '1048576',                 'type': int,    'arg': ('--chunk-size-max'                       ,) },
     REDIRECT_ADDRESS:           { 'default': '127.0.0.1',               'type': str,    'arg': ('--redirect-address'                     ,) },
+    API_CONCURRENCY:            { 'default': '4',                       'type': int,    'arg': ('--api-concurrency'                      ,) },
+    METADATA_CACHE_LOCATION:    { 'default': '',                        'type': str,    'arg': ('--metadata-cache-location'              ,) },
+    METADATA_CACHE_TTL:         { 'default': 'track:30,album:30,artist:7,episode:30,show:1,audiobook:30,chapter:30,playlist:0,user:7',
+                                                                        'type': str,    'arg': ('--metadata-cache-ttl'                   ,) },
+    HTTP_POOL_SIZE:             { 'default': '16',                      'type': int,    'arg': ('--http-pool-size'                       ,) },
+    HTTP_TIMEOUT:               { 'default': '30.0',                    'type': float,  'arg': ('--http-timeout'                         ,) },
+    STREAM_METADATA:            { 'default': 'False',                   'type': bool,   'arg': ('--stream-metadata'                      ,) },
     
     # Terminal & Logging Options
     PRINT_SPLASH:               { 'default': 'False',                   'type': bool,   'arg': ('--print-splash'                         ,) },
@@ -226,6 +245,11 @@ class Config:
         if cls.debug() or args.update_archive or args.verify_library:
             from zotify.utils import SongArchive
             SongArchive.UPDATE_ARCHIVE = True
+        
+        # Check refresh_metadata
+        if getattr(args, "refresh_metadata", False):
+            from zotify.utils import MetadataCache
+            MetadataCache.REFRESH = True
     
     @classmethod
     def get_default_json(cls) -> dict:
@@ -350,6 +374,40 @@ class Config:
     def get_bulk_wait_time(cls) -> float:
         return cls.get(BULK_WAIT_TIME)
     
+    @classmethod
+    def get_download_workers(cls) -> int:
+        return max(1, cls.get(DOWNLOAD_WORKERS))
+    
+    @classmethod
+    def get_download_pipeline(cls) -> bool:
+        return cls.get(DOWNLOAD_PIPELINE)
+    
+    @classmethod
+    def get_transcode_workers(cls) -> int:
+        if cls.get(TRANSCODE_WORKERS) <= 0:
+            return os.cpu_count() or 1
+        return cls.get(TRANSCODE_WORKERS)
+    
+    @classmethod
+    def get_stream_to_ffmpeg(cls) -> bool:
+        return cls.get(STREAM_TO_FFMPEG)
+    
+    @classmethod
+    def get_range_fetch_parts(cls) -> int:
+        return max(1, cls.get(RANGE_FETCH_PARTS))
+    
+    @classmethod
+    def get_range_fetch_threshold(cls) -> int:
+        return cls.get(RANGE_FETCH_THRESHOLD)
+    
+    @classmethod
+    def get_partner_host_connections(cls) -> int:
+        return max(1, cls.get(PARTNER_HOST_CONNECTIONS))
+    
+    @classmethod
+    def get_prefetch_ahead(cls) -> int:
+        return max(0, cls.get(PREFETCH_AHEAD))
+    
     @classmethod
     def get_download_qual_pref(cls) -> str:
         return cls.get(DOWNLOAD_QUALITY)
@@ -578,6 +636,56 @@ class Config:
     def get_chunk_size(cls) -> int:
         return cls.get(CHUNK_SIZE)
     
+    @classmethod
+    def get_api_concurrency(cls) -> int:
+        return max(1, cls.get(API_CONCURRENCY))
+    
+    @classmethod
+    def get_metadata_cache_location(cls) -> PurePath:
+        cache_str: str = cls.get(METADATA_CACHE_LOCATION)
+        if not cache_str:
+            system_paths = {
+                'win32': Path.home() / 'AppData/Roaming/Zotify',
+                'linux': Path.home() / '.local/share/zotify',
+                'darwin': Path.home() / 'Library/Application Support/Zotify'
+            }
+            cache_dir = system_paths.get(sys.platform, Path.cwd() / '.zotify')
+        elif cache_str[0] == ".":
+            cache_dir = Path(cls.get_root_path()) / Path(cache_str).expanduser().relative_to(".")
+        else:
+            cache_dir = Path(cache_str).expanduser()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return PurePath(cache_dir / 'metadata_cache.sqlite')
+    
+    @classmethod
+    def get_metadata_cache_ttl(cls) -> dict[str, float]:
+        """ Seconds each content type's metadata stays cached, parsed from `type:days` pairs """
+        ttls = {}
+        for pair in cls.get(METADATA_CACHE_TTL).split(","):
+            if ":" not in pair: continue
+            type_attr, days = pair.split(":", 1)
+            try: ttls[type_attr.strip().lower()] = float(days) * 86400
+            except ValueError: continue
+        return ttls
+    
+    @classmethod
+    def get_http_pool_size(cls) -> int:
+        return max(1, cls.get(HTTP_POOL_SIZE))
+    
+    @classmethod
+    def get_http_timeout(cls) -> float | None:
+        if cls.get(HTTP_TIMEOUT) <= 0:
+            return None
+        return cls.get(HTTP_TIMEOUT)
+    
+    @classmethod
+    def get_stream_metadata(cls) -> bool:
+        return cls.get(STREAM_METADATA) and cls.get_optimized_dl()
+    
+    @classmethod
+    def get_chunk_size_max(cls) -> int:
+        return max(cls.get(CHUNK_SIZE), cls.get(CHUNK_SIZE_MAX))
+    
     @classmethod
     def get_oauth_address(cls) -> tuple[str, str]:
         redirect_address = cls.get(REDIRECT_ADDRESS)
@@ -646,6 +754,7 @@ class Zotify:
     LOGFILE                 : Path                      = None
     DOWNLOAD_QUALITY        : FormatOnlyAudioQuality    = None
     DOWNLOAD_BITRATE        : str                       = None
+    HTTP                    : requests.Session          = None
     
     # DYNAMIC PER SESSION
     FORCE_STREAM_API_CALLS  : bool                      = False
@@ -661,6 +770,14 @@ class Zotify:
         cls.DATETIME_LAUNCH = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         cls.TOTAL_API_CALLS = 0
     
+    @classmethod
+    def http(cls) -> requests.Session:
+        """ Shared keep-alive session for every Web API, CDN, and image request """
+        if cls.HTTP is None:
+            from zotify.utils import create_session
+            cls.HTTP = create_session(cls.CONFIG.get_http_pool_size())
+        return cls.HTTP
+    
     @classmethod
     def login(cls, args):
         """ Authenticates and saves credentials to a file """
@@ -797,14 +914,34 @@ class Zotify:
         except:
             return
     
+    @classmethod
+    def invoke_libre_api(cls, call: Callable, *args) -> Any:
+        """ Run a librespot api client call under ApiGovernor, like Web API requests, retrying rate limited calls """
+        from zotify.utils import ApiGovernor
+        tryCount = 0
+        while True:
+            ApiGovernor.acquire() # waits out any rate limit pause
+            status_code = None
+            try:
+                result = call(*args)
+                status_code = 200
+                return result
+            except ApiClient.StatusCodeException as e:
+                status_code = e.code
+                if e.code != 429 or tryCount >= cls.CONFIG.get_retry_attempts():
+                    raise
+                tryCount += 1
+            finally:
+                ApiGovernor.release_status(status_code)
+    
     @classmethod
     def invoke_libre_md(cls, ContClass: type, uri: str) -> dict[str, str | int | dict]:
         try:
             content_id = cls.to_libre_content(ContClass, uri)
             if ContClass.clsn == "Playlist":
-                proto = cls.SESSION.api().get_playlist(content_id)
+                proto = cls.invoke_libre_api(cls.SESSION.api().get_playlist, content_id)
             else:
-                proto = getattr(cls.SESSION.api(), f"get_metadata_4_{ContClass.type_attr}")(content_id)
+                proto = cls.invoke_libre_api(getattr(cls.SESSION.api(), f"get_metadata_4_{ContClass.type_attr}"), content_id)
             resp = MessageToDict(proto, preserving_proto_field_name=True)
             if resp.get(GID): resp[GID] = proto.gid # use gid in bytes
             return resp
@@ -814,25 +951,82 @@ class Zotify:
             return {}
     
     @classmethod
-    def invoke_url(cls, url: str, params: dict | None = None, expectFail: bool = False, force_login5: bool = False) -> dict[str, str | int | dict]:
-        def choose_token() -> str:
-            if cls.OAUTH and not force_login5:
-                return cls.OAUTH.token()
-            return cls.SESSION.tokens().get_token(*SCOPES).access_token
+    def fetch_oauth_token(cls) -> tuple[str, float]:
+        # OAuth refreshes itself when needed but does not expose expiry, so hold its token
+        # for a short window and let a 401 force an early renewal
+        return cls.OAUTH.token(), time() + OAUTH_TOKEN_HOLD
+    
+    @classmethod
+    def fetch_login5_token(cls) -> tuple[str, float]:
+        stored = cls.SESSION.tokens().get_token(*SCOPES)
+        return stored.access_token, stored.timestamp / 1_000_000 + stored.expires_in
+    
+    @classmethod
+    def invoke_url(cls, url: str, params: dict | None = None, expectFail: bool = False, force_login5: bool = False,
+                   revalidate: bool = False) -> dict[str, str | int | dict]:
+        """ Concurrent identical requests share one network call, each caller gets its own copy of the response """
+        from zotify.utils import SingleFlight
+        key = ("url", url, str(sorted((params or {}).items())), expectFail, force_login5, revalidate)
+        return SingleFlight.do(key, cls.request_url, url, params, expectFail, force_login5, revalidate, copy_result=True)
+    
+    @classmethod
+    def request_url(cls, url: str, params: dict | None = None, expectFail: bool = False, force_login5: bool = False,
+                    revalidate: bool = False) -> dict[str, str | int | dict]:
+        """ With revalidate, a stored response is sent back as a conditional request and reused if not modified """
+        from zotify.utils import ApiGovernor, TokenCache
+        token_kind = "oauth" if cls.OAUTH and not force_login5 else "login5"
+        token = TokenCache.get(token_kind, cls.fetch_oauth_token if token_kind == "oauth" else cls.fetch_login5_token)
         
         headers = {
-            'Authorization': f'Bearer {choose_token()}',
+            'Authorization': f'Bearer {token}',
             'Accept-Language': f'{cls.CONFIG.get_language()}',
             'Accept': 'application/json',
             'app-platform': 'WebPlayer',
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:136.0) Gecko/20100101 Firefox/136.0'
         }
         
+        if revalidate:
+            from zotify.utils import HttpCache
+            url = requests.Request('GET', url, params=params).prepare().url
+            params = None
+            headers |= HttpCache.conditional_headers(url)
+        
         tryCount = 0
+        responsejson = {}
+        refetched = renewed = False
         while tryCount <= cls.CONFIG.get_retry_attempts():
-            resp = requests.get(url, headers=headers, params=params)
-            cls.TOTAL_API_CALLS += 1
             retry_delay = 5
+            ApiGovernor.acquire()
+            resp = None
+            try:
+                try:
+                    resp = cls.http().get(url, headers=headers, params=params, timeout=cls.CONFIG.get_http_timeout())
+                finally:
+                    ApiGovernor.release(resp)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                tryCount += 1
+                if tryCount > cls.CONFIG.get_retry_attempts():
+                    raise
+                Printer.hashtaged(PrintChannel.WARNING, f'API CONNECTION ERROR (RETRY {tryCount}) - RETRYING\n{e}')
+                sleep(retry_delay)
+                continue
+            cls.TOTAL_API_CALLS += 1
+            if revalidate and resp.status_code == 304 and not refetched:
+                cached = HttpCache.get(url)
+                if cached is not None:
+                    return cached
+                # stored body vanished, fall back to one full GET without spending a retry
+                headers = {k: v for k, v in headers.items() if k not in {'If-None-Match', 'If-Modified-Since'}}
+                refetched = True
+                continue
+            if resp.status_code == 401 and (not renewed or tryCount < cls.CONFIG.get_retry_attempts()):
+                # token revoked or expired early, renew it and retry, the first renewal does not spend a retry
+                TokenCache.invalidate(token_kind, token)
+                token = TokenCache.get(token_kind, cls.fetch_oauth_token if token_kind == "oauth" else cls.fetch_login5_token)
+                headers['Authorization'] = f'Bearer {token}'
+                if renewed: tryCount += 1
+                renewed = True
+                continue
             if resp.status_code == 403 and not expectFail:
                 Printer.hashtaged(PrintChannel.WARNING, f'API ERROR\n' +
                                                         f'ATTEMPTING TO ACCESS FORBIDDEN ENDPOINT')
@@ -847,10 +1041,11 @@ class Zotify:
                 if fallback_code in {403, 429}:
                     fallback_message = "Too Many Requests, Rate Limit Exceeded"
                     if resp.headers.get(RETRY_AFTER):
+                        # the governor holds every caller, this one included, until the window passes
                         fallback_message += f". Timed out for {resp.headers[RETRY_AFTER]} seconds."
-                        retry_delay += int(resp.headers[RETRY_AFTER])
                 responsejson = {ERROR: {STATUS: fallback_code,  MESSAGE: fallback_message}}
             if resp.ok and resp.status_code == 200 and not responsejson.get(ERROR):
+                if revalidate: HttpCache.put(url, resp.headers.get('ETag'), resp.headers.get('Last-Modified'), responsejson)
                 return responsejson
             elif not expectFail:
                 retry_text = f"(RETRY {tryCount}) " if tryCount else ""
@@ -870,22 +1065,56 @@ class Zotify:
         
         return {}
     
-    @classmethod
-    def invoke_url_nextable(cls, url: str, stripper: tuple[str] | str = None, max: int = 0, params: dict = {}) -> list[dict] | dict[str, list[dict]]:
+    @staticmethod
+    def offset_pages(nextable: dict, max: int = 0) -> list[str]:
+        """ URLs for every remaining page, derived from the next link by rewriting its offset """
+        stop = min(nextable.get(TOTAL) or 0, max) if max else nextable.get(TOTAL) or 0
+        if not nextable.get(NEXT) or not stop:
+            return []
+        next_url = urlsplit(nextable[NEXT])
+        query = dict(parse_qsl(next_url.query))
+        if OFFSET not in query or not nextable.get(LIMIT):
+            return [] # cursor paginated, pages must be followed one at a time
+        return [urlunsplit(next_url._replace(query=urlencode(query | {OFFSET: offset})))
+                for offset in range(int(query[OFFSET]), stop, nextable[LIMIT])]
+    
+    @classmethod
+    def invoke_url_nextable(cls, url: str, stripper: tuple[str] | str = None, max: int = 0, params: dict = {},
+                            revalidate: bool = False) -> list[dict] | dict[str, list[dict]]:
         
-        def handle_next(resp: dict, strip: str | None, total: int = 0) -> list[dict]:
+        def handle_next(resp: dict, strip: str | None) -> list[dict]:
             nextable: dict = resp.get(strip, resp)
             items: list[dict] = nextable.get(ITEMS)
             if not items:
-                p = "PAGINATED " if total > 0 else ""
-                Printer.hashtaged(PrintChannel.WARNING, f'NO ITEMS FOUND IN {p}API RESPONSE')
+                Printer.hashtaged(PrintChannel.WARNING, f'NO ITEMS FOUND IN API RESPONSE')
                 Printer.debug(resp)
                 return []
-            elif nextable.get(NEXT) is None or (max and total + len(items) >= max):
-                return items[:max-total] if max else items
-            return items + handle_next(cls.invoke_url(nextable[NEXT]), strip, total + len(items))
+            items = list(items)
+            
+            pages = cls.offset_pages(nextable, max)
+            if pages and cls.CONFIG.get_api_concurrency() > 1:
+                with ThreadPoolExecutor(cls.CONFIG.get_api_concurrency(), thread_name_prefix="zotify-api") as executor:
+                    resps = list(executor.map(lambda page: cls.invoke_url(page, revalidate=revalidate), pages))
+                for page_resp in resps:
+                    page_items = page_resp.get(strip, page_resp).get(ITEMS)
+                    if not page_items:
+                        Printer.hashtaged(PrintChannel.WARNING, f'NO ITEMS FOUND IN PAGINATED API RESPONSE')
+                        Printer.debug(page_resp)
+                        break
+                    items.extend(page_items)
+                return items[:max] if max else items
+            
+            while nextable.get(NEXT) is not None and not (max and len(items) >= max):
+                resp = cls.invoke_url(nextable[NEXT], revalidate=revalidate)
+                nextable = resp.get(strip, resp)
+                if not nextable.get(ITEMS):
+                    Printer.hashtaged(PrintChannel.WARNING, f'NO ITEMS FOUND IN PAGINATED API RESPONSE')
+                    Printer.debug(resp)
+                    break
+                items.extend(nextable[ITEMS])
+            return items[:max] if max else items
         
-        resp = cls.invoke_url(url, {LIMIT: 50, OFFSET: 0} | params)
+        resp = cls.invoke_url(url, {LIMIT: 50, OFFSET: 0} | params, revalidate=revalidate)
         if isinstance(stripper, tuple) and not resp:
             Printer.hashtaged(PrintChannel.WARNING, 'SEARCH FAILED\n' + 
                                                     'IF AN API ERROR INDICATED "Invalid Limit",\n' +
@@ -895,21 +1124,78 @@ class Zotify:
             return {strip: handle_next(resp, strip) for strip in stripper}
         return handle_next(resp, stripper) if resp else []
     
+    @classmethod
+    def iter_url_nextable(cls, url: str, params: dict = {}, revalidate: bool = False) -> Iterator[list[dict]]:
+        """ invoke_url_nextable yielding the items one page at a time, in order, as each page arrives """
+        nextable = cls.invoke_url(url, {LIMIT: 50, OFFSET: 0} | params, revalidate=revalidate)
+        if not nextable or not nextable.get(ITEMS):
+            Printer.hashtaged(PrintChannel.WARNING, f'NO ITEMS FOUND IN API RESPONSE')
+            Printer.debug(nextable)
+            return
+        yield nextable[ITEMS]
+        
+        pages = cls.offset_pages(nextable)
+        if pages and cls.CONFIG.get_api_concurrency() > 1:
+            executor = ThreadPoolExecutor(cls.CONFIG.get_api_concurrency(), thread_name_prefix="zotify-api")
+            try:
+                for page_resp in executor.map(lambda page: cls.invoke_url(page, revalidate=revalidate), pages):
+                    if not page_resp.get(ITEMS):
+                        Printer.hashtaged(PrintChannel.WARNING, f'NO ITEMS FOUND IN PAGINATED API RESPONSE')
+                        Printer.debug(page_resp)
+                        return
+                    yield page_resp[ITEMS]
+            finally: # also reached when the consumer closes this early, drop the pages not yet requested
+                executor.shutdown(wait=False, cancel_futures=True)
+            return
+        
+        while nextable.get(NEXT) is not None:
+            nextable = cls.invoke_url(nextable[NEXT], revalidate=revalidate)
+            if not nextable.get(ITEMS):
+                Printer.hashtaged(PrintChannel.WARNING, f'NO ITEMS FOUND IN PAGINATED API RESPONSE')
+                Printer.debug(nextable)
+                return
+            yield nextable[ITEMS]
+    
     @classmethod
     def invoke_url_bulk(cls, url: str, bulk_items: list[str], stripper: str, limit: int = 50) -> list[dict[str, str | int | dict]]:
         items = []
-        while len(bulk_items):
-            items_batch = '%2c'.join(bulk_items[:limit])
-            bulk_items = bulk_items[limit:]
-            
-            resp = cls.invoke_url(url + items_batch)
-            if not resp: # assume 403 forbidden, warning handled in invoke_url
-                return items
-            elif not resp.get(stripper):
-                Printer.hashtaged(PrintChannel.WARNING, f'STRIPPER "{stripper}" NOT FOUND IN API RESPONSE FOR BULK URL: {url}')
-                continue
-            items.extend(resp[stripper])
-        return items
+        batches = ['%2c'.join(bulk_items[i:i+limit]) for i in range(0, len(bulk_items), limit)]
+        executor = ThreadPoolExecutor(cls.CONFIG.get_api_concurrency(), thread_name_prefix="zotify-api")
+        try:
+            # at most API_CONCURRENCY batches are in flight, results are consumed in input order
+            futures = [executor.submit(cls.invoke_url, url + items_batch) for items_batch in batches]
+            for future in futures:
+                resp = future.result()
+                if not resp: # assume 403 forbidden, warning handled in invoke_url
+                    return items
+                elif not resp.get(stripper):
+                    Printer.hashtaged(PrintChannel.WARNING, f'STRIPPER "{stripper}" NOT FOUND IN API RESPONSE FOR BULK URL: {url}')
+                    continue
+                items.extend(resp[stripper])
+            return items
+        finally:
+            executor.shutdown(cancel_futures=True) # drop batches queued after an early return
+    
+    @classmethod
+    def resolve_cdn_source(cls, gid: str, file: AudioFile):
+        """ Fetch the audio key and a CDN url for one audio file """
+        from zotify.utils import CdnSource
+        key = cls.SESSION.audio_key().get_audio_key(gid, file.file_id)
+        url = CdnFeedHelper.get_url(cls.SESSION.content_feeder().resolve_storage_interactive(file.file_id, False))
+        return CdnSource(file.file_id.hex(), key, url)
+    
+    @classmethod
+    def open_cdn_stream(cls, file: AudioFile, source) -> tuple[Streamer, object]:
+        """ Open a CDN stream from a resolved source, returning the source it was opened with """
+        streamer = cls.SESSION.cdn().stream_file(file, source.key, source.url, None)
+        if streamer.stream().skip(0xA7) != 0xA7: raise IOError("Couldn't skip 0xa7 bytes!")
+        return streamer, source
+    
+    @classmethod
+    def prefetch_cdn_source(cls, content):
+        """ Resolve the CDN source get_content_stream would use for content at the preferred quality """
+        file = cls.DOWNLOAD_QUALITY.get_file([ParseDict(f, AudioFile()) for f in content.file_ids])
+        return cls.resolve_cdn_source(content.gid, file)
     
     @classmethod
     def get_content_stream(cls, content, use_qual_pref: bool = True) -> Streamer | None:
@@ -918,6 +1204,8 @@ class Zotify:
         content_id = cls.to_libre_content(content.__class__, content.uri)
         if not content_id: return
         qual = cls.DOWNLOAD_QUALITY if use_qual_pref else cls.parse_dl_quality()[1]
+        from zotify.utils import CdnPrefetcher
+        content.cdn_source = None
         Printer.logger(f'Fetching stream for {content.uri} at quality {qual.preferred.name}')
         try:
             if not content.file_ids or cls.FORCE_STREAM_API_CALLS:
@@ -929,10 +1217,13 @@ class Zotify:
                 url = cls.SESSION.client().head(content.external_url).url
                 return cls.SESSION.cdn().stream_external_episode(content, url, None)
             file = qual.get_file([ParseDict(f, AudioFile()) for f in content.file_ids])
-            key = cls.SESSION.audio_key().get_audio_key(content.gid, file.file_id)
-            url = cls.SESSION.content_feeder().resolve_storage_interactive(file.file_id, False)
-            streamer = cls.SESSION.cdn().stream_file(file, key, CdnFeedHelper.get_url(url), None)
-            if streamer.stream().skip(0xA7) != 0xA7: raise IOError("Couldn't skip 0xa7 bytes!")
+            source = CdnPrefetcher.take(content, file.file_id.hex()) if use_qual_pref else None
+            try:
+                streamer, content.cdn_source = cls.open_cdn_stream(file, source or cls.resolve_cdn_source(content.gid, file))
+            except Exception as e:
+                if source is None: raise
+                Printer.logger(f'Prefetched CDN Source Failed, Resolving Again\n{e}', PrintChannel.DEBUG)
+                streamer, content.cdn_source = cls.open_cdn_stream(file, cls.resolve_cdn_source(content.gid, file))
             return streamer
         except FeederException as e:
             if not use_qual_pref:
@@ -968,7 +1259,7 @@ class Zotify:
     @classmethod
     def get_user_profile(cls, username: str) -> dict:
         try:
-            return cls.SESSION.api().get_user_profile(username)
+            return cls.invoke_libre_api(cls.SESSION.api().get_user_profile, username)
         except Exception as e:
             Printer.debug(f"Failed to fetch user profile for {username}")
             Printer.traceback(e)
@@ -979,6 +1270,9 @@ class Zotify:
         cls.start()
         logging.shutdown()
         
+        from zotify.utils import TokenCache
+        TokenCache.clear() # stop the refresh timers
+        
         # delete non-debug logfiles if empty (no critical errors)
         if cls.LOGFILE.exists():
             with open(cls.LOGFILE) as file:
@@ -986,8 +1280,10 @@ class Zotify:
             if not lines:
                 cls.LOGFILE.unlink()
         
+        from zotify.utils import PartialDownload
         for dir in (Path(cls.CONFIG.get_root_path()), Path(cls.CONFIG.get_root_podcast_path())):
             for tempfile in dir.glob("*.tmp"):
+                    if PartialDownload.sidecar_exists(tempfile): continue # resumable next run
                     tempfile.unlink()
         
         print("\n")
@@ -60,6 +60,7 @@ EXTERNAL_ID = 'external_id'
 EXTERNAL_IDS = 'external_ids'
 EXTERNAL_URL = 'external_url'
 EXTERNAL_URLS = 'external_urls'
+FIELDS = 'fields'
 FILE = 'file'
 FILE_ID = 'file_id'
 FOLLOWERS = 'followers'
@@ -85,6 +86,7 @@ LENGTH = 'length'
 LINES = 'lines'
 LINE_SYNCED = 'LINE_SYNCED'
 LIMIT = 'limit'
+LINKED_FROM = 'linked_from'
 MESSAGE = 'message'
 MINUTE = 'minute'
 MONTH = 'month'
@@ -171,6 +173,7 @@ SCOPES = [
     'user-library-read',
     'user-read-email',
     'user-read-private']
+OAUTH_TOKEN_HOLD = 300 # seconds an OAuth bearer token is reused before asking OAuth again
 
 # System Constants
 LINUX_SYSTEM = 'Linux'
@@ -280,4 +283,19 @@ DISCOG_BY_ALBUM_ARTIST = 'DISCOG_BY_ALBUM_ARTIST'
 API_CLIENT_ID = 'API_CLIENT_ID'
 DOWNLOAD_RATE_LIMITER = 'DOWNLOAD_RATE_LIMITER'
 API_CLIENT_LEGACY = 'API_CLIENT_LEGACY'
-OUTPUT_M3U8 = 'OUTPUT_M3U8'
\ No newline at end of file
+OUTPUT_M3U8 = 'OUTPUT_M3U8'
+DOWNLOAD_WORKERS = 'DOWNLOAD_WORKERS'
+DOWNLOAD_PIPELINE = 'DOWNLOAD_PIPELINE'
+TRANSCODE_WORKERS = 'TRANSCODE_WORKERS'
+STREAM_TO_FFMPEG = 'STREAM_TO_FFMPEG'
+CHUNK_SIZE_MAX = 'CHUNK_SIZE_MAX'
+RANGE_FETCH_PARTS = 'RANGE_FETCH_PARTS'
+RANGE_FETCH_THRESHOLD = 'RANGE_FETCH_THRESHOLD'
+PARTNER_HOST_CONNECTIONS = 'PARTNER_HOST_CONNECTIONS'
+PREFETCH_AHEAD = 'PREFETCH_AHEAD'
+API_CONCURRENCY = 'API_CONCURRENCY'
+METADATA_CACHE_LOCATION = 'METADATA_CACHE_LOCATION'
+METADATA_CACHE_TTL = 'METADATA_CACHE_TTL'
+HTTP_POOL_SIZE = 'HTTP_POOL_SIZE'
+HTTP_TIMEOUT = 'HTTP_TIMEOUT'
+STREAM_METADATA = 'STREAM_METADATA'
\ No newline at end of file
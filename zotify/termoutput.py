@@ -1,7 +1,6 @@
 from __future__ import annotations
 from contextlib import contextmanager
 from enum import Enum
-from functools import partial
 from itertools import cycle
 from mutagen import FileType
 from os import get_terminal_size, system
@@ -9,12 +8,10 @@ from platform import system as platform_system
 from pprint import pformat
 from re import split, escape
 from tabulate import tabulate
-from threading import Thread
+from threading import Thread, current_thread, main_thread
 from time import sleep
 from tqdm import tqdm
-from tqdm.auto import tqdm as tqdmauto
 from traceback import TracebackException
-from urllib3 import HTTPResponse
 
 from zotify.const import *
 
@@ -277,13 +274,13 @@ class Printer:
     # Progress Bars
     @staticmethod
     def pbar(iterable=None, desc=None, total=None, unit='it', disable=False,
-              unit_scale=False, unit_divisor=1000, default_pos=1, pbar_stack=[]) -> tqdm:
+              unit_scale=False, unit_divisor=1000, default_pos=1, pbar_stack=[], initial=0) -> tqdm:
         pos = default_pos
         if pbar_stack:
             pos = -pbar_stack[-1].pos + (0 if pbar_stack[-1].disable else -2)
         if iterable and len(iterable) == 1 and len(Printer.ACTIVE_PBARS) > 0:
             disable = True # minimize clutter
-        new_pbar = tqdm(iterable=iterable, desc=desc, total=total, disable=disable, position=pos, 
+        new_pbar = tqdm(iterable=iterable, desc=desc, total=total, initial=initial, disable=disable, position=pos, 
                         unit=unit, unit_scale=unit_scale, unit_divisor=unit_divisor, leave=False)
         if new_pbar.disable: new_pbar.pos = -pos
         if not new_pbar.disable: Printer.ACTIVE_PBARS.append(new_pbar)
@@ -298,11 +295,6 @@ class Printer:
             if pbar_stack[-1].n == pbar_stack[-1].total: 
                 pbar_stack.pop()
                 if not pbar_stack[-1].disable: Printer.ACTIVE_PBARS.pop()
-    
-    @staticmethod
-    def pbar_stream(stream: HTTPResponse, total: int | None = None, desc: str = ""):
-        stream.read = partial(stream.read, decode_content=True)  # Decompress if needed
-        return tqdmauto.wrapattr(stream, "read", total=total, desc=desc)
 
 
 class Loader:
@@ -349,10 +341,11 @@ class Loader:
         elif mode == 'prog':
             self.steps = ["[∙∙∙]","[●∙∙]","[∙●∙]","[∙∙●]","[∙∙∙]"]
         
-        self.disabled = disabled
+        # only the main thread owns the active loader, download workers stay silent
+        self.disabled = disabled or current_thread() is not main_thread()
         if self.channel is not PrintChannel.MANDATORY:
             from zotify.config import Zotify
-            self.disabled = disabled or Zotify.CONFIG.get_standard_interface()
+            self.disabled = self.disabled or Zotify.CONFIG.get_standard_interface()
         self.done = False
         self.paused = False
         self.dead = False
@@ -1,15 +1,28 @@
 import ffmpy
+import json
 import os
+import requests
+import sqlite3
 import subprocess
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
 from datetime import datetime, timezone
 from fractions import Fraction
 from pathlib import Path, PurePath
-from shutil import move, copyfile, copyfileobj
+from queue import Queue
+from shutil import move, copyfile, copyfileobj, which
+from tempfile import TemporaryFile
+from threading import BoundedSemaphore, Condition, Event, Lock, Thread, Timer
+from typing import Any, Callable, Hashable, Iterable
+from urllib.parse import urlsplit
 
+from Cryptodome.Cipher import AES
+from Cryptodome.Util import Counter
 from zotify.config import Zotify
-from zotify.const import EXT_MAP
+from zotify.const import EXT_MAP, RETRY_AFTER
 from zotify.termoutput import PrintChannel, Printer
 
 
@@ -100,6 +113,29 @@ def check_path_dupes(path: PurePath) -> PurePath:
     return new_path
 
 
+class PathReservations:
+    """ Output paths claimed by downloads that have not written them yet, so concurrent workers resolving
+        the same name are handed distinct paths before anything exists on disk """
+    _RESERVED: set[PurePath] = set()
+    _LOCK: Lock = Lock()
+    
+    @classmethod
+    def reserve(cls, path: PurePath) -> PurePath:
+        """ check_path_dupes, also stepping past paths other in-flight downloads hold """
+        with cls._LOCK:
+            free_path, c = check_path_dupes(path), 0
+            while free_path in cls._RESERVED or (free_path != path and Path(free_path).exists()):
+                c += 1
+                free_path = path.with_stem(f"{path.stem}_{c}")
+            cls._RESERVED.add(free_path)
+            return free_path
+    
+    @classmethod
+    def release(cls, path: PurePath) -> None:
+        with cls._LOCK:
+            cls._RESERVED.discard(path)
+
+
 def get_common_dir(allpaths: set[PurePath]) -> PurePath:
     if len({p.name for p in allpaths}) == 1:
         # only one path or only multiples of one path
@@ -107,6 +143,43 @@ def get_common_dir(allpaths: set[PurePath]) -> PurePath:
     return PurePath(os.path.commonpath(allpaths))
 
 
+class PartialDownload:
+    """ Sidecar next to a .tmp file recording which stream it holds and how much of it was written,
+        so an interrupted download can continue from that offset in a later run """
+    
+    def __init__(self, temppath: PurePath, content_id: str, file_id: str, size: int):
+        self.temppath = Path(temppath)
+        self.path = self.temppath.with_name(self.temppath.name + ".json")
+        self.info = {"content_id": content_id, "file_id": file_id, "size": size}
+    
+    @staticmethod
+    def sidecar_exists(temppath: PurePath) -> bool:
+        return Path(temppath).with_name(Path(temppath).name + ".json").exists()
+    
+    def load(self) -> tuple[int, int] | None:
+        """ Returns the (stream position, bytes written) to resume from, if the sidecar matches this stream """
+        if not self.path.exists() or not self.temppath.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved: dict = json.load(f)
+        except (OSError, ValueError):
+            return
+        if any(saved.get(k) != v for k, v in self.info.items()):
+            return
+        position, written = saved.get("position", 0), saved.get("written", 0)
+        if not (0 < written <= self.temppath.stat().st_size) or not 0 < position <= self.info["size"]:
+            return
+        return position, written
+    
+    def save(self, position: int, written: int) -> None:
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.info | {"position": position, "written": written}, f)
+    
+    def discard(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
 # Input Processing Utils
 def safe_typecast(d: dict, k: str, to_cast: type, except_channel: PrintChannel = PrintChannel.WARNING):
     raw_val = d.get(k)
@@ -257,6 +330,41 @@ def run_ffm(in_path: PurePath, in_cmd: list[str] | None, out_path: PurePath | No
     return stdout.decode().strip()
 
 
+def pipe_ffm(chunks: Iterable[bytes | memoryview], out_path: PurePath, out_cmd: list[str]) -> None:
+    """ Feed chunks to ffmpeg's stdin and write only the final output file, raising if ffmpeg fails.
+        ffmpeg writes to a sibling that only replaces out_path once it succeeds, so no failure leaves a truncated file """
+    if which("ffmpeg") is None:
+        raise ffmpy.FFExecutableNotFoundError("Executable 'ffmpeg' not found")
+    part_path = Path(out_path).with_name(f"{out_path.stem}.part{out_path.suffix}") # keep the suffix ffmpeg muxes by
+    cmd = ['ffmpeg', '-hide_banner', '-loglevel', Zotify.CONFIG.get_ffmpeg_log_level(), '-y',
+           '-i', 'pipe:0', *out_cmd, str(part_path)]
+    
+    try:
+        with TemporaryFile() as stderr: # a file instead of a PIPE, so a chatty ffmpeg can't deadlock the writer
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=stderr)
+            try:
+                for chunk in chunks:
+                    proc.stdin.write(chunk)
+            except BrokenPipeError:
+                pass # ffmpeg exited early, reported through its return code
+            except BaseException:
+                proc.kill()
+                raise
+            finally:
+                try: proc.stdin.close()
+                except BrokenPipeError: pass
+                proc.wait()
+            stderr.seek(0)
+            err = stderr.read().decode(errors="replace").replace('\r\n', '\n')
+        
+        Printer.logger("STDERR:\n" + err, PrintChannel.DEBUG)
+        if proc.returncode != 0:
+            raise ffmpy.FFRuntimeError(cmd, proc.returncode, b"", err.encode())
+        part_path.replace(out_path)
+    finally:
+        part_path.unlink(missing_ok=True)
+
+
 # Time Utils
 def fmt_duration(duration: float | int, unit_conv: tuple[int, int] = (60, 60), connectors: tuple[str, str] = (":", ":"), smallest_unit: str = "s", ALWAYS_ALL_UNITS: bool = False) -> str:
     """ Formats a duration to a time string, defaulting to seconds -> hh:mm:ss format """
@@ -294,24 +402,616 @@ def strptime_utc(dtstr: str) -> datetime:
     return datetime.strptime(dtstr[:-1], r'%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
 
 
-def wait_between_downloads(skip_wait: bool = False) -> None:
-    waittime = Zotify.CONFIG.get_bulk_wait_time()
-    if not waittime or waittime <= 0:
-        return
-    
-    if skip_wait:
-        time.sleep(min(0.5, waittime))
+def wait_between_downloads() -> None:
+    """ Block until the item bucket allows another download to start """
+    bucket = RateLimiter.items()
+    if bucket is None:
         return
     
+    waittime = bucket.reserve(1)
     if waittime > 5:
-        Printer.hashtaged(PrintChannel.DOWNLOADS, f'PAUSED: WAITING FOR {waittime} SECONDS BETWEEN DOWNLOADS')
+        Printer.hashtaged(PrintChannel.DOWNLOADS, f'PAUSED: WAITING FOR {waittime:.0f} SECONDS BETWEEN DOWNLOADS')
     time.sleep(waittime)
 
 
+# Concurrency Utils
+class StagedPipeline:
+    """ Pushes items through consecutive stages connected by bounded queues, so each stage
+        works on a different item at the same time. A stage returning None drops the item. """
+    _DONE = object()
+    
+    def __init__(self, stages: list[tuple[str, Callable[[Any], Any], int]], queue_size: int = 1):
+        self.stages = stages
+        self.queues: list[Queue] = [Queue(maxsize=queue_size) for _ in stages]
+        self.busy: list[float] = [0.] * len(stages)
+        self.busy_lock = Lock()
+        self.abort = Event()
+        self.error: BaseException | None = None
+        self.time_start = 0.
+        self.time_end = 0.
+    
+    def _work(self, i: int, remaining: list[int]) -> None:
+        _, func, _ = self.stages[i]
+        inbox = self.queues[i]
+        outbox = self.queues[i+1] if i+1 < len(self.stages) else None
+        while True:
+            item = inbox.get()
+            if item is self._DONE:
+                with self.busy_lock:
+                    remaining[i] -= 1
+                    last_worker = remaining[i] == 0
+                if not last_worker: inbox.put(self._DONE) # wake sibling workers
+                elif outbox:        outbox.put(self._DONE)
+                return
+            if self.abort.is_set(): continue # drain without working
+            
+            time_start = time.time()
+            try:
+                result = func(item)
+            except BaseException as e:
+                if self.error is None: self.error = e
+                self.abort.set()
+                continue
+            finally:
+                with self.busy_lock:
+                    self.busy[i] += time.time() - time_start
+            if result is not None and outbox:
+                outbox.put(result)
+    
+    def run(self, items: Iterable, on_feed: Callable[[], None] | None = None) -> None:
+        """ Feed items into the first stage and block until every stage has finished """
+        remaining = [n for _, _, n in self.stages]
+        threads = [Thread(target=self._work, args=(i, remaining), daemon=True, name=f"zotify-{name}")
+                   for i, (name, _, n) in enumerate(self.stages) for _ in range(n)]
+        self.time_start = time.time()
+        for thread in threads: thread.start()
+        try:
+            for item in items:
+                if self.abort.is_set(): break
+                self.queues[0].put(item)
+                if on_feed: on_feed()
+        except BaseException:
+            self.abort.set()
+            raise
+        finally:
+            self.queues[0].put(self._DONE)
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.1) # stay responsive to KeyboardInterrupt
+        except BaseException:
+            self.abort.set() # let the workers drain and exit instead of downloading on
+            raise
+        self.time_end = time.time()
+        if self.error is not None:
+            raise self.error
+    
+    def utilization(self) -> dict[str, float]:
+        """ Fraction of the pipeline's wall time each stage spent working, averaged over its workers """
+        wall = max(self.time_end - self.time_start, 1e-9)
+        return {name: self.busy[i] / (wall * n) for i, (name, _, n) in enumerate(self.stages)}
+
+
+class BackgroundFeed:
+    """ Runs a producer of item batches on a background thread, handing out each item in order as soon as
+        its batch is ready. items holds everything produced so far, so consumers can look ahead of their position """
+    
+    def __init__(self, batches: Iterable[list], name: str = "zotify-feed"):
+        self.items: list = []
+        self.finished = False
+        self.abort = Event()
+        self.error: BaseException | None = None
+        self.cond = Condition()
+        self.thread = Thread(target=self._produce, args=(batches,), daemon=True, name=name)
+        self.thread.start()
+    
+    def _produce(self, batches: Iterable[list]) -> None:
+        batches = iter(batches)
+        try:
+            for batch in batches:
+                if self.abort.is_set(): break
+                with self.cond:
+                    self.items.extend(batch)
+                    self.cond.notify_all()
+        except BaseException as e:
+            self.error = e
+        finally:
+            if self.abort.is_set() and hasattr(batches, "close"):
+                batches.close() # unwind the producer so it stops fetching ahead
+            with self.cond:
+                self.finished = True
+                self.cond.notify_all()
+    
+    def __iter__(self):
+        i = 0
+        while True:
+            with self.cond:
+                while i >= len(self.items) and not self.finished:
+                    self.cond.wait(0.1) # stay responsive to KeyboardInterrupt
+                if i >= len(self.items): break
+                item = self.items[i]
+            yield item
+            i += 1
+        if self.error is not None:
+            raise self.error
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    def close(self) -> None:
+        """ Stop the producer once its current batch is done """
+        self.abort.set()
+
+
+def has_native_readinto(stream: Any) -> bool:
+    """ True if readinto is implemented alongside read, rather than inherited from a buffer base class
+        (e.g. a BytesIO subclass overriding read would silently readinto from its empty internal buffer) """
+    mro = type(stream).__mro__
+    def definer(attr: str) -> int:
+        return next((i for i, c in enumerate(mro) if attr in vars(c)), len(mro))
+    return definer("readinto") <= definer("read")
+
+
+class AdaptiveReader:
+    """ Reads a stream in chunks sized to the measured throughput, doubling while reads return full chunks
+        quickly and halving when a read stalls. Reuses one preallocated buffer when the stream supports it,
+        in which case a returned chunk is only valid until the next read. """
+    TARGET_LATENCY = 0.1 # seconds per read
+    
+    def __init__(self, stream: Any, min_size: int, max_size: int):
+        self.stream = stream
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.size = self.min_size
+        self.view: memoryview | None = None
+        if has_native_readinto(stream):
+            self.view = memoryview(bytearray(self.max_size))
+    
+    def read(self) -> bytes | memoryview:
+        time_start = time.monotonic()
+        if self.view is not None:
+            n = self.stream.readinto(self.view[:self.size]) or 0
+            chunk = self.view[:n]
+        else:
+            chunk = self.stream.read(self.size)
+            n = len(chunk)
+        latency = time.monotonic() - time_start
+        
+        if n == self.size and latency < self.TARGET_LATENCY / 2:
+            self.size = min(self.max_size, self.size * 2)
+        elif latency > self.TARGET_LATENCY * 2:
+            self.size = max(self.min_size, self.size // 2)
+        return chunk
+
+
+class TokenBucket:
+    """ Thread-safe token bucket, callers reserve tokens up front and sleep off any deficit,
+        so concurrent consumers share one rate without idling while tokens are available """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = Lock()
+    
+    def reserve(self, n: float) -> float:
+        """ Take n tokens, going into debt if needed, and return the seconds to wait before using them """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= n
+            return max(0., -self.tokens / self.rate)
+    
+    def consume(self, n: float) -> None:
+        waittime = self.reserve(n)
+        if waittime > 0: time.sleep(waittime)
+
+
+class RateLimiter:
+    """ Process-wide buckets every download path consults, built from DOWNLOAD_RATE_LIMITER and BULK_WAIT_TIME """
+    LOSSLESS_BITRATE = "1411k"
+    _BYTES: TokenBucket | None = None
+    _ITEMS: TokenBucket | None = None
+    _INIT_LOCK: Lock = Lock()
+    
+    @classmethod
+    def bytes(cls) -> TokenBucket | None:
+        """ Stream bytes at the nominal bitrate slowed by DOWNLOAD_RATE_LIMITER, None if disabled """
+        multiplier = Zotify.CONFIG.get_dl_rate_limter()
+        if multiplier <= 0:
+            return None
+        with cls._INIT_LOCK:
+            if cls._BYTES is None:
+                bitrate = Zotify.DOWNLOAD_BITRATE or cls.LOSSLESS_BITRATE
+                rate = int(bitrate[:-1]) * 1000 / 8 / multiplier
+                cls._BYTES = TokenBucket(rate, max(rate, Zotify.CONFIG.get_chunk_size()))
+        return cls._BYTES
+    
+    @classmethod
+    def items(cls) -> TokenBucket | None:
+        """ Start at most one download per BULK_WAIT_TIME, None if disabled """
+        waittime = Zotify.CONFIG.get_bulk_wait_time()
+        if not waittime or waittime <= 0:
+            return None
+        with cls._INIT_LOCK:
+            if cls._ITEMS is None:
+                cls._ITEMS = TokenBucket(1 / waittime, 1)
+        return cls._ITEMS
+
+
+class SingleFlight:
+    """ Coalesces identical lookups. The first caller for a key does the work, callers arriving before it
+        finishes wait for it and share the outcome instead of repeating the request """
+    _CALLS: dict[Hashable, list[Future | int]] = {} # key -> [future, number of waiters]
+    _LOCK: Lock = Lock()
+    
+    @classmethod
+    def do(cls, key: Hashable, fn: Callable, *args, copy_result: bool = False) -> Any:
+        """ copy_result hands waiters deep copies of a snapshot taken before the leader returns,
+            for results callers may mutate. Nothing is copied when no one waited """
+        with cls._LOCK:
+            call = cls._CALLS.get(key)
+            leader = call is None
+            if leader:
+                call = cls._CALLS[key] = [Future(), 0]
+            else:
+                call[1] += 1
+        future: Future = call[0]
+        if not leader:
+            result, n_waiters = future.result()
+            return deepcopy(result) if copy_result and n_waiters > 1 else result # a lone waiter owns the snapshot
+        
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            with cls._LOCK:
+                del cls._CALLS[key]
+            future.set_exception(e)
+            raise
+        with cls._LOCK: # no one can join once the key is gone
+            n_waiters = cls._CALLS.pop(key)[1]
+        if n_waiters:
+            future.set_result((deepcopy(result) if copy_result else result, n_waiters))
+        return result
+
+
+class TranscodeFarm:
+    """ Caps the number of concurrent ffmpeg encodes, blocking new conversion jobs while every slot is busy,
+        and splits the host's cores between the encodes that can run in parallel """
+    _SLOTS: BoundedSemaphore | None = None
+    _SLOTS_LOCK: Lock = Lock()
+    
+    @staticmethod
+    def parallel_encodes() -> int:
+        workers = Zotify.CONFIG.get_transcode_workers()
+        if not Zotify.CONFIG.get_optimized_dl():
+            return 1
+        if Zotify.CONFIG.get_download_pipeline():
+            return workers
+        return min(workers, Zotify.CONFIG.get_download_workers())
+    
+    @classmethod
+    def thread_budget(cls) -> int:
+        return max(1, (os.cpu_count() or 1) // cls.parallel_encodes())
+    
+    @classmethod
+    @contextmanager
+    def slot(cls):
+        with cls._SLOTS_LOCK:
+            if cls._SLOTS is None:
+                cls._SLOTS = BoundedSemaphore(Zotify.CONFIG.get_transcode_workers())
+        with cls._SLOTS:
+            yield
+
+
+class ApiGovernor:
+    """ Process-wide gate for API requests. The in-flight limit grows by one request per window of successes and
+        halves on a rate limit, capped at API_CONCURRENCY, while a Retry-After pauses every caller, not just the
+        one that was refused """
+    DEFAULT_PENALTY = 5 # seconds, when a 429 carries no usable Retry-After
+    _LIMIT: float = 0.
+    _IN_FLIGHT: int = 0
+    _PAUSED_UNTIL: float = 0.
+    _COND: Condition = Condition()
+    
+    @classmethod
+    def acquire(cls) -> None:
+        with cls._COND:
+            ceiling = Zotify.CONFIG.get_api_concurrency()
+            if not cls._LIMIT: cls._LIMIT = ceiling
+            while True:
+                pause = cls._PAUSED_UNTIL - time.monotonic()
+                if pause > 0:
+                    cls._COND.wait(pause)
+                elif cls._IN_FLIGHT >= int(cls._LIMIT):
+                    cls._COND.wait()
+                else:
+                    break
+            cls._IN_FLIGHT += 1
+    
+    @classmethod
+    def release(cls, resp: requests.Response | None) -> None:
+        """ Report how the request went, resp is None if it never got a response """
+        if resp is None:
+            cls.release_status(None)
+        else:
+            cls.release_status(resp.status_code, resp.headers.get(RETRY_AFTER))
+    
+    @classmethod
+    def release_status(cls, status_code: int | None, retry_after: str | None = None) -> None:
+        """ release for clients that only surface a status code, like librespot's api client """
+        with cls._COND:
+            cls._IN_FLIGHT -= 1
+            ceiling = Zotify.CONFIG.get_api_concurrency()
+            if status_code == 429:
+                try:
+                    penalty = float(retry_after)
+                except (TypeError, ValueError):
+                    penalty = cls.DEFAULT_PENALTY
+                now = time.monotonic()
+                # requests already in flight when the limit hit report it too, only cut once per penalty window
+                if cls._PAUSED_UNTIL <= now:
+                    cls._LIMIT = max(1., cls._LIMIT / 2)
+                    Printer.hashtaged(PrintChannel.WARNING, f'API RATE LIMITED - PAUSING ALL REQUESTS FOR {penalty:g}s\n' +
+                                                            f'Concurrency lowered to {int(cls._LIMIT)}')
+                cls._PAUSED_UNTIL = max(cls._PAUSED_UNTIL, now + penalty)
+            elif status_code is not None and status_code < 400:
+                cls._LIMIT = min(ceiling, cls._LIMIT + 1 / cls._LIMIT)
+            cls._COND.notify_all()
+
+
+# HTTP Utils
+def create_session(pool_size: int) -> requests.Session:
+    """ Keep-alive session whose connection pool can serve pool_size concurrent requests per host """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class PartnerClient:
+    """ Pooled client for partner-hosted episode files, which are served by third-party hosts outside
+        the main service's rate limits, with a per-host connection limit and Range resume after failures """
+    _SESSION: requests.Session | None = None
+    _HOSTS: dict[str, BoundedSemaphore] = {}
+    _LOCK: Lock = Lock()
+    
+    @classmethod
+    def session(cls) -> requests.Session:
+        with cls._LOCK:
+            if cls._SESSION is None:
+                cls._SESSION = create_session(Zotify.CONFIG.get_partner_host_connections())
+        return cls._SESSION
+    
+    @classmethod
+    @contextmanager
+    def host_slot(cls, url: str):
+        host = urlsplit(url).netloc
+        with cls._LOCK:
+            if host not in cls._HOSTS:
+                cls._HOSTS[host] = BoundedSemaphore(Zotify.CONFIG.get_partner_host_connections())
+        with cls._HOSTS[host]:
+            yield
+    
+    @classmethod
+    def download(cls, url: str, path: PurePath, on_progress: Callable[[int, int | None], None] | None = None) -> None:
+        """ Download url to path, resuming with a Range request when a transfer breaks off """
+        written = 0
+        attempt = 0
+        with cls.host_slot(url), open(path, 'wb') as file:
+            while True:
+                headers = {"Range": f"bytes={written}-"} if written else {}
+                try:
+                    with cls.session().get(url, headers=headers, stream=True, allow_redirects=True,
+                                           timeout=Zotify.CONFIG.get_http_timeout()) as r:
+                        r.raise_for_status() # Will only raise for 4xx/5xx codes, so...
+                        if r.status_code not in {200, 206}:
+                            raise RuntimeError(f"Request to {url} returned status code {r.status_code}")
+                        if r.status_code == 200 and written: # host ignored the Range header, start over
+                            written = 0; file.seek(0); file.truncate()
+                        length = int(r.headers.get('Content-Length', 0))
+                        total = written + length if length else None
+                        if on_progress: on_progress(written, total)
+                        for chunk in r.iter_content(64 * 1024):
+                            written += file.write(chunk)
+                            if on_progress: on_progress(written, total)
+                        if total is not None and written < total:
+                            raise requests.ConnectionError(f"Connection closed after {written} of {total} bytes")
+                    return
+                except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                    attempt += 1
+                    if attempt > Zotify.CONFIG.get_retry_attempts():
+                        raise
+                    file.flush()
+                    Printer.hashtaged(PrintChannel.WARNING, str(e) + '\n' + f'RESUMING DIRECT DOWNLOAD AT BYTE {written}')
+
+
+class TokenCache:
+    """ Bearer tokens kept in memory until shortly before they expire. A daemon timer renews each token ahead of
+        expiry, so API calls only read the cached value and never wait on Login5 or OAuth themselves. A token no
+        request read since it was last stored is not renewed, until a request reads it again """
+    REFRESH_MARGIN = 120 # seconds before expiry to renew
+    _TOKENS: dict[str, tuple[str, float]] = {}
+    _FETCHERS: dict[str, Callable[[], tuple[str, float]]] = {}
+    _TIMERS: dict[str, Timer] = {}
+    _USED: set[str] = set()
+    _LOCK: Lock = Lock()
+    
+    @classmethod
+    def get(cls, kind: str, fetch: Callable[[], tuple[str, float]]) -> str:
+        """ fetch returns (token, expires_at) and is only called on a miss or from the refresh timer """
+        cls._USED.add(kind)
+        entry = cls._TOKENS.get(kind)
+        if entry and entry[1] > time.time():
+            if kind not in cls._TIMERS:
+                with cls._LOCK: cls._arm(kind, entry[1])
+            return entry[0]
+        with cls._LOCK:
+            entry = cls._TOKENS.get(kind)
+            if entry and entry[1] > time.time():
+                return entry[0]
+            cls._FETCHERS[kind] = fetch
+            token = cls._store(kind, *fetch())
+            cls._USED.add(kind)
+            return token
+    
+    @classmethod
+    def _store(cls, kind: str, token: str, expires_at: float) -> str:
+        cls._TOKENS[kind] = (token, expires_at)
+        cls._USED.discard(kind)
+        cls._arm(kind, expires_at)
+        return token
+    
+    @classmethod
+    def _arm(cls, kind: str, expires_at: float) -> None:
+        if cls._TIMERS.get(kind): cls._TIMERS[kind].cancel()
+        timer = Timer(max(expires_at - time.time() - cls.REFRESH_MARGIN, 1), cls._refresh, (kind,))
+        timer.daemon = True
+        timer.start()
+        cls._TIMERS[kind] = timer
+    
+    @classmethod
+    def _refresh(cls, kind: str) -> None:
+        with cls._LOCK:
+            if kind not in cls._USED:
+                # idle since the last refresh, stop renewing until a request asks for it again
+                cls._TIMERS.pop(kind, None)
+                return
+            try:
+                cls._store(kind, *cls._FETCHERS[kind]())
+            except Exception as e:
+                # leave the current token in place, the next call past its expiry fetches synchronously
+                Printer.logger(f'Background Token Refresh Failed for {kind}\n{e}', PrintChannel.DEBUG)
+    
+    @classmethod
+    def invalidate(cls, kind: str, token: str) -> None:
+        """ Drop a token the server rejected, unless it was already replaced """
+        with cls._LOCK:
+            entry = cls._TOKENS.get(kind)
+            if entry and entry[0] == token:
+                del cls._TOKENS[kind]
+    
+    @classmethod
+    def clear(cls) -> None:
+        with cls._LOCK:
+            for timer in cls._TIMERS.values(): timer.cancel()
+            cls._TIMERS.clear()
+            cls._TOKENS.clear()
+            cls._USED.clear()
+
+
+# CDN Utils
+class CdnSource:
+    """ A resolved CDN url and audio key for one encrypted file, enough to fetch and decrypt any byte range of it """
+    AUDIO_AES_IV = int.from_bytes(b'r\xe0g\xfb\xdd\xcb\xcfw\xeb\xe8\xbcd?c\r\x93', "big")
+    EXPIRY_REGEX = re.compile(r'(?:exp=|Expires=)(\d+)')
+    
+    def __init__(self, file_id: str, key: bytes, url: str):
+        self.file_id = file_id
+        self.key = key
+        self.url = url
+        expiry = self.EXPIRY_REGEX.search(url)
+        self.expires: int | None = int(expiry.group(1)) if expiry else None
+    
+    def expired(self, margin: float = 30.) -> bool:
+        return self.expires is not None and time.time() + margin >= self.expires
+    
+    def decryptor(self, offset: int):
+        """ AES-CTR cipher positioned at a 16-byte aligned offset into the file """
+        return AES.new(key=self.key, mode=AES.MODE_CTR, counter=Counter.new(128, initial_value=self.AUDIO_AES_IV + offset // 16))
+    
+    def fetch_range(self, start: int, end: int, out_path: PurePath, out_offset: int,
+                    on_chunk: Callable[[int], None] | None = None) -> None:
+        """ Decrypt bytes [start, end) of the file into out_path at out_offset """
+        aligned = start - start % 16
+        drop = start - aligned
+        r = Zotify.http().get(self.url, headers={"Range": f"bytes={aligned}-{end - 1}"}, stream=True,
+                              timeout=Zotify.CONFIG.get_http_timeout())
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise IOError(f"CDN ignored range request, status code {r.status_code}")
+        
+        cipher = self.decryptor(aligned)
+        written = 0
+        with open(out_path, 'r+b') as file:
+            file.seek(out_offset)
+            for block in r.iter_content(64 * 1024):
+                data = cipher.decrypt(block)
+                if drop:
+                    n = min(drop, len(data))
+                    data = data[n:]; drop -= n
+                written += file.write(data)
+                if on_chunk: on_chunk(len(data))
+        if written != end - start:
+            raise IOError(f"Range {start}-{end} returned {written} of {end - start} bytes")
+    
+    def fetch_ranges(self, start: int, size: int, out_path: PurePath, parts: int,
+                     on_chunk: Callable[[int], None] | None = None) -> None:
+        """ Fetch bytes [start, size) as parallel ranges split on block boundaries, reassembled in order in out_path """
+        step = -(-(size - start) // parts)
+        step += -step % 16
+        bounds = [start, *range(start - start % 16 + step, size, step), size]
+        with open(out_path, 'wb') as file:
+            file.truncate(size - start)
+        
+        with ThreadPoolExecutor(max_workers=len(bounds) - 1, thread_name_prefix="zotify-range") as executor:
+            futures = [executor.submit(self.fetch_range, a, b, out_path, a - start, on_chunk)
+                       for a, b in zip(bounds, bounds[1:])]
+            for future in futures:
+                future.result()
+
+
+class CdnPrefetcher:
+    """ Resolves audio keys and CDN urls for upcoming tracks in the background, while the current one streams """
+    _EXECUTOR: ThreadPoolExecutor | None = None
+    _PENDING: dict[str, Future] = {}
+    _LOCK: Lock = Lock()
+    
+    @classmethod
+    def schedule(cls, contents: list) -> None:
+        if Zotify.FORCE_STREAM_API_CALLS: return
+        with cls._LOCK:
+            if cls._EXECUTOR is None:
+                # one worker keeps key requests sequential, they are the most rate limited call
+                cls._EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zotify-prefetch")
+            for content in contents:
+                if content.uri in cls._PENDING or content.downloaded or not content.file_ids \
+                    or getattr(content, "external_url", None):
+                    continue
+                cls._PENDING[content.uri] = cls._EXECUTOR.submit(Zotify.prefetch_cdn_source, content)
+    
+    @classmethod
+    def take(cls, content, file_id: str) -> CdnSource | None:
+        """ Pop a prefetched source for content, waiting if it is still resolving.
+            Returns None if it failed, expired, or no longer matches the chosen file """
+        with cls._LOCK:
+            future = cls._PENDING.pop(content.uri, None)
+        if future is None:
+            return
+        try:
+            source: CdnSource = future.result()
+        except Exception as e:
+            Printer.logger(f'CDN Prefetch Failed for {content.uri}\n{e}', PrintChannel.DEBUG)
+            return
+        if source.file_id != file_id or source.expired():
+            return
+        return source
+    
+    @classmethod
+    def clear(cls) -> None:
+        with cls._LOCK:
+            for future in cls._PENDING.values(): future.cancel()
+            cls._PENDING.clear()
+
+
 # Song Archive Utils
 class SongArchive:
     """ Entry: id, date, author, name, filepath (only filename if from legacy archive) """
     UPDATE_ARCHIVE: bool = False
+    _WRITE_LOCK: Lock = Lock()
     
     def __init__(self, dir_path: PurePath | None = None):
         self._global = dir_path is None
@@ -375,7 +1075,7 @@ class SongArchive:
         if not timestamp:
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         entry = f'{item_id}\t{timestamp}\t{author_name}\t{item_name}\t{item_path}\n'
-        with open(self.filepath, mode, encoding='utf-8') as file:
+        with self._WRITE_LOCK, open(self.filepath, mode, encoding='utf-8') as file:
             file.write(entry)
     
     def add_obj(self, obj, item_path: PurePath) -> None:
@@ -387,6 +1087,153 @@ class SongArchive:
         self.add_entry(obj.id, "", author_name, item_name, item_path, self.mode)
 
 
+# Metadata Cache Utils
+class MetadataCache:
+    """ Persistent per-entity cache of raw metadata responses, keyed by content type, id, source, and language.
+        Entries expire after the TTL configured for their content type in METADATA_CACHE_TTL """
+    REFRESH: bool = False
+    BYTES_MARKER = "__bytes__"
+    _CONN: sqlite3.Connection | None = None
+    _LOCK: Lock = Lock()
+    
+    @classmethod
+    def dumps(cls, resp: dict) -> str:
+        """ JSON encode a response, keeping bytes values (like the gid of libre responses) as marked hex """
+        def encode(o):
+            if isinstance(o, bytes): return {cls.BYTES_MARKER: o.hex()}
+            raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+        return json.dumps(resp, default=encode)
+    
+    @classmethod
+    def loads(cls, resp: str) -> dict:
+        decode = lambda d: bytes.fromhex(d[cls.BYTES_MARKER]) if len(d) == 1 and cls.BYTES_MARKER in d else d
+        return json.loads(resp, object_hook=decode)
+    
+    @classmethod
+    def conn(cls) -> sqlite3.Connection:
+        if cls._CONN is None:
+            cls._CONN = sqlite3.connect(Zotify.CONFIG.get_metadata_cache_location(), check_same_thread=False)
+            cls._CONN.execute("PRAGMA journal_mode=WAL")
+            cls._CONN.execute("CREATE TABLE IF NOT EXISTS metadata (type TEXT, id TEXT, source TEXT, language TEXT, " +
+                              "fetched_at REAL, resp TEXT, PRIMARY KEY (type, id, source, language))")
+            cls._CONN.execute("CREATE TABLE IF NOT EXISTS http_cache (url TEXT, language TEXT, etag TEXT, " +
+                              "last_modified TEXT, body TEXT, PRIMARY KEY (url, language))")
+            cls._CONN.execute("CREATE TABLE IF NOT EXISTS playlist_sync (id TEXT, language TEXT, snapshot_id TEXT, " +
+                              "items TEXT, PRIMARY KEY (id, language))")
+            cls._CONN.commit()
+        return cls._CONN
+    
+    @staticmethod
+    def ttl(ContClass: type) -> float:
+        ttls = Zotify.CONFIG.get_metadata_cache_ttl()
+        for c in ContClass.__mro__: # subclasses like TopTrack fall back to their parent's TTL
+            if getattr(c, "type_attr", None) in ttls:
+                return ttls[c.type_attr]
+        return 0
+    
+    @classmethod
+    def get_many(cls, ContClass: type, ids: list[str], source: str) -> dict[str, dict]:
+        """ Returns the unexpired cached responses among ids, by id """
+        ttl = cls.ttl(ContClass)
+        if cls.REFRESH or ttl <= 0 or not ids:
+            return {}
+        hits: dict[str, dict] = {}
+        unique_ids = list(dict.fromkeys(ids))
+        with cls._LOCK:
+            for i in range(0, len(unique_ids), 500):
+                batch = unique_ids[i:i+500]
+                rows = cls.conn().execute(f"SELECT id, resp FROM metadata WHERE type = ? AND source = ? AND language = ? " +
+                                          f"AND fetched_at > ? AND id IN ({','.join('?' * len(batch))})",
+                                          [ContClass.type_attr, source, Zotify.CONFIG.get_language(), time.time() - ttl, *batch])
+                hits.update({id: cls.loads(resp) for id, resp in rows})
+        return hits
+    
+    @classmethod
+    def get(cls, ContClass: type, id: str, source: str) -> dict | None:
+        return cls.get_many(ContClass, [id], source).get(id)
+    
+    @classmethod
+    def put_many(cls, ContClass: type, resps: dict[str, dict | None], source: str) -> None:
+        """ Store each non-empty response under its own id """
+        if cls.ttl(ContClass) <= 0:
+            return
+        now = time.time()
+        rows = [(ContClass.type_attr, id, source, Zotify.CONFIG.get_language(), now, cls.dumps(resp))
+                for id, resp in resps.items() if resp]
+        if not rows:
+            return
+        with cls._LOCK:
+            cls.conn().executemany("INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?)", rows)
+            cls.conn().commit()
+    
+    @classmethod
+    def put(cls, ContClass: type, id: str, resp: dict, source: str) -> None:
+        cls.put_many(ContClass, {id: resp}, source)
+
+
+class HttpCache:
+    """ Stores list endpoint responses with their validators, so later runs can revalidate with a conditional
+        request and reuse the stored body when the server answers 304 Not Modified """
+    
+    @staticmethod
+    def conditional_headers(url: str) -> dict[str, str]:
+        if MetadataCache.REFRESH:
+            return {}
+        with MetadataCache._LOCK:
+            row = MetadataCache.conn().execute("SELECT etag, last_modified FROM http_cache WHERE url = ? AND language = ?",
+                                               (url, Zotify.CONFIG.get_language())).fetchone()
+        if row is None:
+            return {}
+        etag, last_modified = row
+        headers = {}
+        if etag: headers['If-None-Match'] = etag
+        if last_modified: headers['If-Modified-Since'] = last_modified
+        return headers
+    
+    @staticmethod
+    def get(url: str) -> dict | None:
+        with MetadataCache._LOCK:
+            row = MetadataCache.conn().execute("SELECT body FROM http_cache WHERE url = ? AND language = ?",
+                                               (url, Zotify.CONFIG.get_language())).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    @staticmethod
+    def put(url: str, etag: str | None, last_modified: str | None, body: dict) -> None:
+        if not (etag or last_modified):
+            return
+        with MetadataCache._LOCK:
+            MetadataCache.conn().execute("INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?)",
+                                         (url, Zotify.CONFIG.get_language(), etag, last_modified, json.dumps(body)))
+            MetadataCache.conn().commit()
+
+
+class PlaylistSync:
+    """ The full item list of each playlist as of its last synced snapshot_id. An unchanged playlist is rebuilt
+        from it without paging, a changed one reuses its entries for every item it still contains """
+    
+    @staticmethod
+    def get(playlist_id: str) -> tuple[str, list[dict]] | None:
+        """ Returns (snapshot_id, items) of the last sync """
+        if MetadataCache.REFRESH:
+            return None
+        with MetadataCache._LOCK:
+            row = MetadataCache.conn().execute("SELECT snapshot_id, items FROM playlist_sync WHERE id = ? AND language = ?",
+                                               (playlist_id, Zotify.CONFIG.get_language())).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+    
+    @staticmethod
+    def put(playlist_id: str, snapshot_id: str, items: list[dict], total: int | None) -> None:
+        """ Skipped unless items holds all total entries, a listing cut short by a failed page
+            would otherwise stand in for the whole playlist until its snapshot changes """
+        if total is None or len(items) != total:
+            Printer.debug(f'Playlist {playlist_id} Sync Not Recorded: {len(items)} of {total} Items Fetched')
+            return
+        with MetadataCache._LOCK:
+            MetadataCache.conn().execute("INSERT OR REPLACE INTO playlist_sync VALUES (?, ?, ?, ?)",
+                                         (playlist_id, Zotify.CONFIG.get_language(), snapshot_id, json.dumps(items)))
+            MetadataCache.conn().commit()
+
+
 # M3U8 Playlist File Utils
 class M3U8():
     def __init__(self, cont_paths: list[PurePath | None], cont_type: type, parent_cont):